@@ -0,0 +1,20 @@
+from rest_framework.exceptions import ValidationError
+
+
+def parse_id_list(request, param, limit=100):
+    """
+    Integer ids from a comma separated query parameter, e.g. ?post_ids=1,2,3.
+    Values that are not integers are skipped. More than `limit` ids raises
+    ValidationError, which DRF returns as a 400 with an 'error' message.
+    """
+    ids = []
+    for value in request.query_params.get(param, '').split(','):
+        try:
+            ids.append(int(value))
+        except ValueError:
+            continue
+    
+    if len(ids) > limit:
+        noun = param.removesuffix('_ids').replace('_', ' ')
+        raise ValidationError({'error': f'At most {limit} {noun} ids can be checked at once'})
+    return ids
@@ -0,0 +1,44 @@
+"""
+Version counters for namespaced cache invalidation.
+
+Cached values are keyed with the current version of the data they were
+built from (e.g. f'services:list:{get_version("services")}:...'), and a
+write bumps the version instead of hunting down every key. Old entries
+are never read again and expire on their own timeouts.
+
+A missing counter starts from the current time in milliseconds rather
+than 1, so a counter that was evicted cannot come back at a value that
+old entries were stored under. Counters themselves never expire; the
+entries keyed on them always have a timeout.
+
+The counters only work if every process shares them, so the default
+cache must be shared between workers (see CACHES in settings).
+"""
+import time
+
+from django.core.cache import cache
+
+
+def version_key(namespace):
+    return f'version:{namespace}'
+
+
+def get_version(namespace):
+    """Current version of namespace"""
+    key = version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    """Move namespace to a new version, orphaning everything cached under the old one"""
+    key = version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = int(time.time() * 1000)
+        cache.set(key, version, None)
+        return version
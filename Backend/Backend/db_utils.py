@@ -0,0 +1,69 @@
+from django.db import connection
+from django.utils import timezone
+
+
+def insert_ignore(model, **values):
+    """
+    INSERT a row with ON CONFLICT DO NOTHING.
+
+    Works for any unique constraint on the table, including partial unique
+    indexes. auto_now_add fields are filled in. Returns True if a row was
+    inserted and False if it already existed.
+    """
+    opts = model._meta
+    qn = connection.ops.quote_name
+    for field in opts.concrete_fields:
+        if getattr(field, 'auto_now_add', False) and field.name not in values:
+            values[field.name] = timezone.now()
+
+    columns, params = [], []
+    for name, value in values.items():
+        field = opts.get_field(name)
+        if field.is_relation and hasattr(value, 'pk'):
+            value = value.pk
+        columns.append(qn(field.column))
+        params.append(field.get_db_prep_save(value, connection))
+
+    sql = (
+        f"INSERT INTO {qn(opts.db_table)} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(params))}) ON CONFLICT DO NOTHING"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount == 1
+
+
+def upsert_add(model, conflict_fields, rows, add_fields, batch_size=200):
+    """
+    INSERT rows, adding add_fields onto any row that already exists.
+
+    rows is a list of dicts with the same keys, covering every NOT NULL
+    column. conflict_fields must match a unique constraint on the table.
+    Each batch of rows is one statement:
+    INSERT ... ON CONFLICT (conflict_fields) DO UPDATE SET f = f + excluded.f
+    """
+    if not rows:
+        return
+    opts = model._meta
+    qn = connection.ops.quote_name
+    table = qn(opts.db_table)
+    fields = [opts.get_field(name) for name in rows[0]]
+    columns = ', '.join(qn(field.column) for field in fields)
+    placeholders = f"({', '.join(['%s'] * len(fields))})"
+    conflict = ', '.join(qn(opts.get_field(name).column) for name in conflict_fields)
+    updates = ', '.join(
+        f"{column} = {table}.{column} + excluded.{column}"
+        for column in (qn(opts.get_field(name).column) for name in add_fields)
+    )
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            params = []
+            for row in batch:
+                params.extend(field.get_db_prep_save(row[field.name], connection) for field in fields)
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES {', '.join([placeholders] * len(batch))} "
+                f"ON CONFLICT ({conflict}) DO UPDATE SET {updates}",
+                params,
+            )
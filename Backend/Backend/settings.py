@@ -55,6 +55,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so that cached pages skip everything below (see frontendCore.middleware)
+    'frontendCore.middleware.AnonymousPageCacheMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -183,6 +185,45 @@ SIMPLE_JWT = {
 GOOGLE_OAUTH_CLIENT_ID = 'YOUR_GOOGLE_CLIENT_ID'  # Replace with your Google OAuth Client ID
 GOOGLE_OAUTH_CLIENT_SECRET = 'YOUR_GOOGLE_CLIENT_SECRET'  # Replace with your Google OAuth Client Secret
 
+# Blog view counts are buffered per worker and flushed in batches
+BLOG_VIEW_FLUSH_INTERVAL = config('BLOG_VIEW_FLUSH_INTERVAL', default=10, cast=int)  # seconds
+BLOG_VIEW_FLUSH_MAX_PENDING = config('BLOG_VIEW_FLUSH_MAX_PENDING', default=1000, cast=int)
+
+# Appointments per time slot when no SlotCapacity rule matches
+APPOINTMENT_SLOT_CAPACITY = config('APPOINTMENT_SLOT_CAPACITY', default=1, cast=int)
+
+# Email. Requests only queue messages in the outbox (frontendCore.outbox);
+# nothing is delivered unless the send_outbound_emails worker runs (see
+# "Background Jobs" in the README for it and the other periodic commands).
+EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = config('EMAIL_HOST', default='localhost')
+EMAIL_PORT = config('EMAIL_PORT', default=25, cast=int)
+EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
+EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
+EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=False, cast=bool)
+DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='webmaster@localhost')
+
+# Cache shared by every worker process and management command. The cached
+# pages and API responses are invalidated by version counters
+# (Backend.caching), so all processes must see the same counters: a
+# per-process LocMemCache is only correct with a single process. The
+# default needs no extra service; set CACHE_BACKEND and CACHE_LOCATION
+# for Redis or Memcached, e.g. django.core.cache.backends.redis.RedisCache
+# and redis://127.0.0.1:6379/1 (needs the redis package).
+CACHE_BACKEND = config('CACHE_BACKEND', default='django.core.cache.backends.filebased.FileBasedCache')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default=str(BASE_DIR / '.cache')),
+    }
+}
+if CACHE_BACKEND.endswith('FileBasedCache'):
+    # The default 300 entries is far too few for per-page entries
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=20000, cast=int)}
+
+# Seconds anonymous frontend pages stay in the full-page cache; 0 disables it
+FRONTEND_PAGE_CACHE_TIMEOUT = config('FRONTEND_PAGE_CACHE_TIMEOUT', default=0 if DEBUG else 600, cast=int)
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR.parent / 'Frontend' / 'media'
@@ -28,7 +28,8 @@ urlpatterns = [
     path('api/blog/', include('Blog.urls')),
     path('api/reviews/', include('Review.urls')),
     path('api/auth/', include('Authentication.urls')),
-    path('api/cart/', include('Cart.urls'))
+    path('api/cart/', include('Cart.urls')),
+    path('api/appointments/', include('frontendCore.api_urls'))
 ]
 
 # Serve media and static files in development
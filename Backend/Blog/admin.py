@@ -5,20 +5,20 @@ from .models import BlogPost, BlogCategory, BlogTag
 
 @admin.register(BlogCategory)
 class BlogCategoryAdmin(admin.ModelAdmin):
-    list_display = ['name', 'slug', 'created_at']
+    list_display = ['name', 'slug', 'published_post_count', 'created_at']
     list_filter = ['created_at']
     search_fields = ['name', 'description']
     prepopulated_fields = {'slug': ('name',)}
-    readonly_fields = ['created_at']
+    readonly_fields = ['published_post_count', 'created_at']
 
 
 @admin.register(BlogTag)
 class BlogTagAdmin(admin.ModelAdmin):
-    list_display = ['name', 'slug', 'created_at']
+    list_display = ['name', 'slug', 'published_post_count', 'created_at']
     list_filter = ['created_at']
     search_fields = ['name']
     prepopulated_fields = {'slug': ('name',)}
-    readonly_fields = ['created_at']
+    readonly_fields = ['published_post_count', 'created_at']
 
 
 @admin.register(BlogPost)
@@ -30,7 +30,7 @@ class BlogPostAdmin(admin.ModelAdmin):
     list_filter = ['status', 'featured', 'created_at', 'published_at', 'author']
     search_fields = ['title', 'description', 'content', 'meta_keywords']
     prepopulated_fields = {'slug': ('title',)}
-    readonly_fields = ['view_count', 'created_at', 'updated_at', 'seo_preview']
+    readonly_fields = ['view_count', 'created_at', 'updated_at', 'seo_preview', 'publish_scheduled']
     
     fieldsets = (
         ('Basic Information', {
@@ -41,7 +41,7 @@ class BlogPostAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
         ('Publishing', {
-            'fields': ('status', 'featured', 'published_at'),
+            'fields': ('status', 'featured', 'published_at', 'publish_scheduled'),
             'classes': ('collapse',)
         }),
         ('Categorization', {
@@ -0,0 +1,47 @@
+"""
+System author for blog posts written without an authenticated user.
+"""
+import threading
+
+from django.contrib.auth import get_user_model
+
+SYSTEM_AUTHOR_USERNAME = 'admin'
+
+_lock = threading.Lock()
+_system_author = None
+# Kept apart from the instance, whose pk is cleared if it is deleted
+_system_author_pk = None
+
+
+def get_system_author():
+    """
+    Return the 'admin' user used as author for anonymous writes.
+    It is looked up (and created if missing) once per process, then cached.
+    """
+    global _system_author, _system_author_pk
+    if _system_author is None:
+        with _lock:
+            if _system_author is None:
+                _system_author, _ = get_user_model().objects.get_or_create(
+                    username=SYSTEM_AUTHOR_USERNAME,
+                    defaults={
+                        'email': 'admin@example.com',
+                        'first_name': 'Admin',
+                        'last_name': 'User',
+                        'is_staff': True,
+                        'is_superuser': True
+                    }
+                )
+                _system_author_pk = _system_author.pk
+    return _system_author
+
+
+def reset_system_author(pk=None):
+    """
+    Forget the cached author, e.g. after the user row was deleted. With pk,
+    only if the cached author is that user.
+    """
+    global _system_author, _system_author_pk
+    with _lock:
+        if pk is None or pk == _system_author_pk:
+            _system_author = _system_author_pk = None
@@ -0,0 +1,106 @@
+"""
+Write-behind buffering for blog post view counts.
+
+Page views are counted in memory per worker and written to the database
+in one batched UPDATE per post. A daemon flusher thread, started with
+the worker's first buffered view, writes the buffer every
+VIEW_FLUSH_INTERVAL seconds whether or not more traffic arrives. A
+request also flushes once VIEW_FLUSH_MAX_PENDING views are pending, and
+the buffer is flushed again at shutdown. A crashed worker loses at most
+the last VIEW_FLUSH_INTERVAL seconds of views. Each flush also adds the
+views to the posts' hourly BlogEngagement rows (Blog.trending).
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+VIEW_FLUSH_INTERVAL = getattr(settings, 'BLOG_VIEW_FLUSH_INTERVAL', 10)
+VIEW_FLUSH_MAX_PENDING = getattr(settings, 'BLOG_VIEW_FLUSH_MAX_PENDING', 1000)
+
+_lock = threading.Lock()
+_pending = Counter()
+_last_flush = time.monotonic()
+# Process that started the flusher; a forked worker starts its own
+_flusher_pid = None
+
+
+def record_view(post_id):
+    """Count a view of post_id, flushing the buffer if it is due"""
+    start_flusher()
+    with _lock:
+        _pending[post_id] += 1
+        due = (
+            sum(_pending.values()) >= VIEW_FLUSH_MAX_PENDING
+            or time.monotonic() - _last_flush >= VIEW_FLUSH_INTERVAL
+        )
+    if due:
+        flush_views()
+
+
+def start_flusher():
+    """Start this process's background flusher thread if it is not running"""
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    with _lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+    threading.Thread(target=_flush_periodically, name='blog-view-flusher', daemon=True).start()
+
+
+def _flush_periodically():
+    while True:
+        time.sleep(VIEW_FLUSH_INTERVAL)
+        try:
+            flush_views()
+        except Exception:
+            logger.exception("Failed to flush buffered blog views")
+        finally:
+            close_old_connections()
+
+
+def flush_views():
+    """Write all buffered views, one UPDATE ... SET view_count = view_count + n per post"""
+    global _pending, _last_flush
+    with _lock:
+        batch, _pending = _pending, Counter()
+        _last_flush = time.monotonic()
+    if not batch:
+        return 0
+
+    from .models import BlogPost, BlogEngagement
+
+    try:
+        with transaction.atomic():
+            for post_id, views in batch.items():
+                BlogPost.objects.filter(pk=post_id).update(view_count=F('view_count') + views)
+            # Hourly rollup for the trending score; posts deleted meanwhile are skipped
+            existing = set(BlogPost.objects.filter(pk__in=batch).values_list('pk', flat=True))
+            BlogEngagement.record({post_id: views for post_id, views in batch.items() if post_id in existing})
+    except Exception:
+        # Keep the views for the next flush instead of dropping them
+        with _lock:
+            _pending.update(batch)
+        raise
+    logger.debug("Flushed %d view(s) for %d blog post(s)", sum(batch.values()), len(batch))
+    return len(batch)
+
+
+def _flush_on_exit():
+    try:
+        flush_views()
+    except Exception:
+        logger.exception("Failed to flush buffered blog views on shutdown")
+
+
+atexit.register(_flush_on_exit)
@@ -0,0 +1,44 @@
+"""
+Cached read path for published blog posts addressed by slug.
+
+A slug maps to a small pointer (post id, updated_at) and the rendered
+JSON payload is stored under a key built from that pointer. A cache hit
+therefore needs two cache reads and no database work. Saves, tag changes
+and category changes drop the pointer (see Blog.signals), so the next
+request re-renders. View and like counters are not written through the
+cache; they can lag by up to POST_CACHE_TIMEOUT. The payload holds
+absolute URLs, so each origin (scheme and host) has its own copy.
+"""
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+POST_CACHE_TIMEOUT = 10 * 60
+
+
+def slug_key(slug):
+    return f'blog:post:slug:{slug}'
+
+
+def payload_key(post_id, updated_at, origin):
+    return f'blog:post:{post_id}:{updated_at.timestamp()}:{origin}'
+
+
+def get_post_payload(slug, origin):
+    """Return the cached JSON bytes for slug as served to origin, or None on a miss"""
+    pointer = cache.get(slug_key(slug))
+    if pointer is None:
+        return None
+    return cache.get(payload_key(*pointer, origin))
+
+
+def set_post_payload(post, data, origin):
+    """Render data to JSON bytes, cache it for post and origin and return the bytes"""
+    payload = JSONRenderer().render(data)
+    cache.set(payload_key(post.id, post.updated_at, origin), payload, POST_CACHE_TIMEOUT)
+    cache.set(slug_key(post.slug), (post.id, post.updated_at), POST_CACHE_TIMEOUT)
+    return payload
+
+
+def invalidate_slugs(slugs):
+    """Drop the pointers for the given slugs so their next read re-renders"""
+    cache.delete_many([slug_key(slug) for slug in slugs if slug])
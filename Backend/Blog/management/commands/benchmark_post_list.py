@@ -0,0 +1,86 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from Blog.listing import render_post_list
+from Blog.models import BlogPost, BlogCategory, BlogTag
+from Blog.serializers import BlogPostListSerializer
+
+
+class Command(BaseCommand):
+    """
+    Compare BlogPostListSerializer with the values() fast path (Blog.listing).
+
+    Sample posts are created inside a transaction that is rolled back at
+    the end, so the command leaves the database as it found it. Each size
+    is rendered by both paths, checked for byte-identical JSON, and timed
+    (best of --repeat, queries included).
+    """
+    help = 'Benchmark blog post list rendering: DRF serializer vs values() fast path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help='Numbers of posts to render')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per size; the best time is reported')
+        parser.add_argument('--tags-per-post', type=int, default=3)
+
+    def handle(self, *args, **options):
+        # Image URLs are absolute, so the request needs a host the site accepts
+        request = RequestFactory().get('/api/blog/posts/', HTTP_HOST=self.allowed_host())
+        with transaction.atomic():
+            posts = self.create_posts(max(options['sizes']), options['tags_per_post'])
+            self.stdout.write(f"{'posts':>6} {'drf ms':>10} {'fast ms':>10} {'speedup':>8}")
+            for size in options['sizes']:
+                queryset = BlogPost.objects.filter(id__in=posts[:size]).select_related('author', 'category').prefetch_related('tags')
+
+                def drf():
+                    return JSONRenderer().render(BlogPostListSerializer(queryset.all(), many=True, context={'request': request}).data)
+
+                def fast():
+                    return JSONRenderer().render(render_post_list(queryset.all(), request))
+
+                if drf() != fast():
+                    raise CommandError(f'Fast path output differs from BlogPostListSerializer at {size} posts')
+                drf_time = self.best_of(drf, options['repeat'])
+                fast_time = self.best_of(fast, options['repeat'])
+                self.stdout.write(f'{size:>6} {drf_time * 1000:>10.2f} {fast_time * 1000:>10.2f} {drf_time / fast_time:>7.1f}x')
+            transaction.set_rollback(True)
+
+    def allowed_host(self):
+        """A concrete host name matching the first ALLOWED_HOSTS entry"""
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+        if host == '*':
+            return 'localhost'
+        # '.example.com' also matches example.com itself
+        return host.lstrip('.')
+
+    def best_of(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def create_posts(self, count, tags_per_post):
+        author, _ = get_user_model().objects.get_or_create(username='benchmark', defaults={'email': 'benchmark@example.com'})
+        category = BlogCategory.objects.create(name='Benchmark category')
+        tags = [BlogTag.objects.create(name=f'Benchmark tag {i}') for i in range(10)]
+        posts = BlogPost.objects.bulk_create([
+            BlogPost(
+                title=f'Benchmark post {i}', slug=f'benchmark-post-{i}', description='Description ' * 10,
+                content='Content ' * 100, image='blog/images/benchmark.jpg' if i % 2 else '',
+                author=author, category=category if i % 3 else None, status='published',
+            )
+            for i in range(count)
+        ])
+        BlogPost.tags.through.objects.bulk_create([
+            BlogPost.tags.through(blogpost_id=post.id, blogtag_id=tags[(i + j) % len(tags)].id)
+            for i, post in enumerate(posts)
+            for j in range(tags_per_post)
+        ])
+        return [post.id for post in posts]
@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from Blog.models import BlogPost
+from Blog.related import RELATED_POSTS_LIMIT, build_related_posts
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the related-posts table (see Blog.related).
+
+    With no options every published post is recomputed; run it nightly.
+    --post and --since-minutes limit the run to the given posts and the
+    posts that share a tag or category with them, for use after edits.
+    """
+    help = 'Precompute related blog posts from tag and category overlap'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--post', type=int, action='append', dest='post_ids', help='Recompute around this post id (repeatable)')
+        parser.add_argument('--since-minutes', type=int, help='Recompute around posts updated in the last N minutes')
+        parser.add_argument('--limit', type=int, default=RELATED_POSTS_LIMIT, help='Related posts kept per post')
+
+    def handle(self, *args, **options):
+        post_ids = options['post_ids']
+        if options['since_minutes'] is not None:
+            since = timezone.now() - timedelta(minutes=options['since_minutes'])
+            recent = BlogPost.objects.filter(updated_at__gte=since).values_list('id', flat=True)
+            post_ids = (post_ids or []) + list(recent)
+            if not post_ids:
+                self.stdout.write('No posts changed; nothing to do')
+                return
+
+        rebuilt = build_related_posts(post_ids, limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt related posts for {rebuilt} post(s)'))
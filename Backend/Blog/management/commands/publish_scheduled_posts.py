@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from Blog.scheduling import PUBLISH_BATCH_SIZE, publish_due_posts
+
+
+class Command(BaseCommand):
+    """
+    Publish drafts whose published_at has passed (see Blog.scheduling).
+
+    Run it from cron every minute, or once with --loop to keep checking
+    every --interval seconds in the foreground.
+    """
+    help = 'Publish scheduled blog posts that are due'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PUBLISH_BATCH_SIZE, help='Posts published per UPDATE')
+        parser.add_argument('--loop', action='store_true', help='Keep running, checking every --interval seconds')
+        parser.add_argument('--interval', type=int, default=60, help='Seconds between checks with --loop')
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            published = publish_due_posts(batch_size=options['batch_size'])
+            if published or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f'Published {published} scheduled post(s)'))
+            if not options['loop']:
+                return
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                return
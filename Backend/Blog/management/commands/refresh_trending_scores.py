@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from Blog.trending import ENGAGEMENT_RETENTION_DAYS, prune_engagement, refresh_trending_scores
+
+
+class Command(BaseCommand):
+    """
+    Batch job, every few minutes: recompute BlogPost.trending_score from
+    the hourly engagement rollups and drop rollups past retention.
+    """
+    help = 'Recompute time-decayed trending scores for blog posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows written per UPDATE batch')
+        parser.add_argument('--keep-days', type=int, default=ENGAGEMENT_RETENTION_DAYS, help='Days of hourly rollups to keep')
+
+    def handle(self, *args, **options):
+        scored = refresh_trending_scores(batch_size=options['batch_size'])
+        pruned = prune_engagement(keep_days=options['keep_days'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Trending scores refreshed for {scored} post(s); pruned {pruned} old rollup row(s)'
+        ))
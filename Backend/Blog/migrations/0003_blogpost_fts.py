@@ -0,0 +1,68 @@
+from django.db import migrations
+
+# SQLite FTS5 index over the searchable BlogPost columns. It is an
+# external-content table kept in sync by triggers; updates that do not
+# touch these columns (view and like counters) leave it alone.
+FTS_SQL = [
+    """
+    CREATE VIRTUAL TABLE blog_post_fts USING fts5(
+        title, description, content, meta_keywords,
+        content='Blog_blogpost', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER blog_post_fts_ai AFTER INSERT ON "Blog_blogpost" BEGIN
+        INSERT INTO blog_post_fts(rowid, title, description, content, meta_keywords)
+        VALUES (new.id, new.title, new.description, new.content, new.meta_keywords);
+    END
+    """,
+    """
+    CREATE TRIGGER blog_post_fts_ad AFTER DELETE ON "Blog_blogpost" BEGIN
+        INSERT INTO blog_post_fts(blog_post_fts, rowid, title, description, content, meta_keywords)
+        VALUES ('delete', old.id, old.title, old.description, old.content, old.meta_keywords);
+    END
+    """,
+    """
+    CREATE TRIGGER blog_post_fts_au AFTER UPDATE OF title, description, content, meta_keywords
+    ON "Blog_blogpost" BEGIN
+        INSERT INTO blog_post_fts(blog_post_fts, rowid, title, description, content, meta_keywords)
+        VALUES ('delete', old.id, old.title, old.description, old.content, old.meta_keywords);
+        INSERT INTO blog_post_fts(rowid, title, description, content, meta_keywords)
+        VALUES (new.id, new.title, new.description, new.content, new.meta_keywords);
+    END
+    """,
+    "INSERT INTO blog_post_fts(blog_post_fts) VALUES ('rebuild')",
+]
+
+DROP_FTS_SQL = [
+    "DROP TRIGGER IF EXISTS blog_post_fts_ai",
+    "DROP TRIGGER IF EXISTS blog_post_fts_ad",
+    "DROP TRIGGER IF EXISTS blog_post_fts_au",
+    "DROP TABLE IF EXISTS blog_post_fts",
+]
+
+
+def create_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in FTS_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in DROP_FTS_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0002_bloglike'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts, drop_fts),
+    ]
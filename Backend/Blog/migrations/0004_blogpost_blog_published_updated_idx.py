@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-19 04:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0003_blogpost_fts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['updated_at'], name='blog_published_updated_idx'),
+        ),
+    ]
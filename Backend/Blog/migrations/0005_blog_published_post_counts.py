@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-19 04:56
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def seed_published_post_counts(apps, schema_editor):
+    """Count the posts that are already published"""
+    BlogPost = apps.get_model('Blog', 'BlogPost')
+    BlogCategory = apps.get_model('Blog', 'BlogCategory')
+    BlogTag = apps.get_model('Blog', 'BlogTag')
+    
+    tagged = BlogPost.tags.through.objects.filter(blogpost__status='published', blogtag_id=OuterRef('pk'))
+    BlogTag.objects.update(published_post_count=Coalesce(Subquery(
+        tagged.order_by().values('blogtag_id').annotate(count=Count('*')).values('count')
+    ), 0))
+    
+    published = BlogPost.objects.filter(status='published', category_id=OuterRef('pk'))
+    BlogCategory.objects.update(published_post_count=Coalesce(Subquery(
+        published.order_by().values('category_id').annotate(count=Count('*')).values('count')
+    ), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0004_blogpost_blog_published_updated_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogcategory',
+            name='published_post_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Published posts in this category (kept by Blog.taxonomy)'),
+        ),
+        migrations.AddField(
+            model_name='blogtag',
+            name='published_post_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Published posts with this tag (kept by Blog.taxonomy)'),
+        ),
+        migrations.RunPython(seed_published_post_counts, migrations.RunPython.noop),
+    ]
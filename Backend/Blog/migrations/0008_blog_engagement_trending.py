@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0007_blogpost_blog_status_published_at_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogEngagement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField(help_text='Start of the hour (UTC)')),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('likes', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Blog Engagement',
+                'verbose_name_plural': 'Blog Engagement',
+            },
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='trending_score',
+            field=models.FloatField(default=0, editable=False, help_text='Time-decayed recent engagement (see Blog.trending)'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['status', '-trending_score', '-id'], name='blog_trending_idx'),
+        ),
+        migrations.AddField(
+            model_name='blogengagement',
+            name='post',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='engagement', to='Blog.blogpost'),
+        ),
+        migrations.AddIndex(
+            model_name='blogengagement',
+            index=models.Index(fields=['hour'], name='blog_engagement_hour_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='blogengagement',
+            constraint=models.UniqueConstraint(fields=('post', 'hour'), name='unique_blog_engagement_hour'),
+        ),
+    ]
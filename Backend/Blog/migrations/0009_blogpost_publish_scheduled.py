@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:19
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def mark_scheduled_drafts(apps, schema_editor):
+    """Drafts already waiting for a future published_at stay scheduled"""
+    BlogPost = apps.get_model('Blog', 'BlogPost')
+    BlogPost.objects.filter(status='draft', published_at__gt=timezone.now()).update(publish_scheduled=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0008_blog_engagement_trending'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='blog_status_published_at_idx',
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='publish_scheduled',
+            field=models.BooleanField(default=False, editable=False, help_text='Draft waiting to be published at published_at (see Blog.scheduling)'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('publish_scheduled', True)), fields=['published_at', 'id'], name='blog_scheduled_idx'),
+        ),
+        migrations.RunPython(mark_scheduled_drafts, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,11 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q
 from django.utils.text import slugify
 from django.conf import settings
 from django.urls import reverse
+from django.utils import timezone
+
+from Backend.db_utils import insert_ignore, upsert_add
 
 
 class BlogPost(models.Model):
@@ -45,16 +49,29 @@ class BlogPost(models.Model):
     featured = models.BooleanField(default=False, help_text="Mark as featured post")
     view_count = models.PositiveIntegerField(default=0, help_text="Number of times this post has been viewed")
     number_of_likes = models.PositiveIntegerField(default=0, help_text="Number of times this post has been liked")
+    trending_score = models.FloatField(default=0, editable=False, help_text="Time-decayed recent engagement (see Blog.trending)")
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
+    publish_scheduled = models.BooleanField(
+        default=False, editable=False,
+        help_text="Draft waiting to be published at published_at (see Blog.scheduling)"
+    )
     
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Blog Post'
         verbose_name_plural = 'Blog Posts'
+        indexes = [
+            # Sitemap and feed signatures (count, latest updated_at)
+            models.Index(fields=['updated_at'], condition=Q(status='published'), name='blog_published_updated_idx'),
+            # Scheduled publishing: due drafts (see Blog.scheduling)
+            models.Index(fields=['published_at', 'id'], condition=Q(publish_scheduled=True), name='blog_scheduled_idx'),
+            # Trending endpoint: top-N published posts in index order
+            models.Index(fields=['status', '-trending_score', '-id'], name='blog_trending_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -70,10 +87,20 @@ class BlogPost(models.Model):
         if not self.meta_description:
             self.meta_description = self.description[:160]
         
+        # Only a draft given a future published_at is scheduled. A post taken
+        # back to draft keeps its old published_at but is not republished.
+        if self.status != 'draft' or not self.published_at:
+            self.publish_scheduled = False
+        elif self.published_at > timezone.now():
+            self.publish_scheduled = True
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'status', 'published_at'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'publish_scheduled'}
+        
         super().save(*args, **kwargs)
     
     def get_absolute_url(self):
-        return reverse('blog:post-detail', kwargs={'slug': self.slug})
+        return reverse('blog:post-detail-slug', kwargs={'slug': self.slug})
     
     def get_keywords_list(self):
         """Return meta keywords as a list"""
@@ -82,14 +109,39 @@ class BlogPost(models.Model):
         return []
     
     def increment_view_count(self):
-        """Increment the view count"""
-        self.view_count += 1
-        self.save(update_fields=['view_count'])
+        """Count a view; written to the database by the view buffer (see Blog.counters)"""
+        from .counters import record_view
+        record_view(self.pk)
+    
+    def add_like(self, user=None, session_key=''):
+        """
+        Like the post as user, or as an anonymous session. Idempotent: the
+        counter only moves when a new BlogLike row is inserted.
+        Returns True if the like was new.
+        """
+        with transaction.atomic():
+            if not insert_ignore(BlogLike, post=self, user=user, session_key=session_key):
+                return False
+            BlogPost.objects.filter(pk=self.pk).update(number_of_likes=F('number_of_likes') + 1)
+            BlogEngagement.record({self.pk: 1}, field='likes')
+        self.refresh_from_db(fields=['number_of_likes'])
+        return True
     
-    def increment_like_count(self):
-        """Increment the like count"""
-        self.number_of_likes += 1
-        self.save(update_fields=['number_of_likes'])
+    def remove_like(self, user=None, session_key=''):
+        """
+        Remove a like by user or session. Idempotent: the counter only moves
+        when a BlogLike row was actually deleted.
+        Returns True if a like was removed.
+        """
+        with transaction.atomic():
+            deleted, _ = BlogLike.objects.owned_by(user, session_key).filter(post=self).delete()
+            if not deleted:
+                return False
+            BlogPost.objects.filter(pk=self.pk, number_of_likes__gt=0).update(
+                number_of_likes=F('number_of_likes') - 1
+            )
+        self.refresh_from_db(fields=['number_of_likes'])
+        return True
 
 
 class BlogCategory(models.Model):
@@ -97,6 +149,7 @@ class BlogCategory(models.Model):
     name = models.CharField(max_length=100, unique=True)
     slug = models.SlugField(max_length=100, unique=True, blank=True)
     description = models.TextField(blank=True)
+    published_post_count = models.PositiveIntegerField(default=0, editable=False, help_text="Published posts in this category (kept by Blog.taxonomy)")
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -117,6 +170,7 @@ class BlogTag(models.Model):
     """Tag model for blog posts"""
     name = models.CharField(max_length=50, unique=True)
     slug = models.SlugField(max_length=50, unique=True, blank=True)
+    published_post_count = models.PositiveIntegerField(default=0, editable=False, help_text="Published posts with this tag (kept by Blog.taxonomy)")
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
@@ -131,3 +185,102 @@ class BlogTag(models.Model):
         if not self.slug:
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
+
+
+
+class BlogLikeQuerySet(models.QuerySet):
+    def owned_by(self, user=None, session_key=''):
+        """Likes made by user or, when user is None, by the anonymous session"""
+        if user is not None:
+            return self.filter(user=user)
+        return self.filter(user__isnull=True, session_key=session_key)
+
+
+class BlogLike(models.Model):
+    """A like on a blog post by a user or, for anonymous visitors, a session"""
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='likes')
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        null=True, blank=True, related_name='blog_likes'
+    )
+    session_key = models.CharField(max_length=40, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    objects = BlogLikeQuerySet.as_manager()
+    
+    class Meta:
+        verbose_name = 'Blog Like'
+        verbose_name_plural = 'Blog Likes'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['post', 'user'],
+                condition=Q(user__isnull=False),
+                name='unique_blog_like_user',
+            ),
+            models.UniqueConstraint(
+                fields=['post', 'session_key'],
+                condition=Q(user__isnull=True),
+                name='unique_blog_like_session',
+            ),
+            models.CheckConstraint(
+                condition=Q(user__isnull=False) | ~Q(session_key=''),
+                name='blog_like_has_owner',
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.user or self.session_key} likes {self.post_id}"
+
+
+class RelatedPost(models.Model):
+    """
+    A precomputed "related post" link, rebuilt by the build_related_posts
+    command (see Blog.related). Each post keeps its top few links by rank.
+    """
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_links')
+    related = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField(help_text="Weighted Jaccard similarity of tags and category")
+    rank = models.PositiveSmallIntegerField()
+    
+    class Meta:
+        ordering = ['post', 'rank']
+        verbose_name = 'Related Post'
+        verbose_name_plural = 'Related Posts'
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'rank'], name='unique_related_post_rank'),
+        ]
+    
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.score:.3f})"
+
+
+class BlogEngagement(models.Model):
+    """Views and new likes of a post within one hour, for the trending score"""
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='engagement')
+    hour = models.DateTimeField(help_text="Start of the hour (UTC)")
+    views = models.PositiveIntegerField(default=0)
+    likes = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = 'Blog Engagement'
+        verbose_name_plural = 'Blog Engagement'
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'hour'], name='unique_blog_engagement_hour'),
+        ]
+        indexes = [
+            models.Index(fields=['hour'], name='blog_engagement_hour_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.post_id} @ {self.hour:%Y-%m-%d %H:00}: {self.views} views, {self.likes} likes"
+    
+    @classmethod
+    def record(cls, counts, field='views', when=None):
+        """Add {post_id: n} to field in the current hour's rows, in one upsert"""
+        hour = (when or timezone.now()).replace(minute=0, second=0, microsecond=0)
+        upsert_add(
+            cls,
+            ['post', 'hour'],
+            [{'post': post_id, 'hour': hour, 'views': 0, 'likes': 0, field: n} for post_id, n in counts.items()],
+            [field],
+        )
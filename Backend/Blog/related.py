@@ -0,0 +1,136 @@
+"""
+Related posts by tag and category overlap.
+
+Every published post is a set of features: its tags, plus its category.
+Features are weighted by rarity (idf), with the category scaled by
+CATEGORY_WEIGHT, and two posts are compared with weighted Jaccard
+similarity, the weight of the features they share over the weight of
+the features either has.
+
+Shared weights are accumulated through an inverted index (feature ->
+posts), which is the sparse form of multiplying the post x feature
+incidence matrix by its transpose: only pairs that share at least one
+feature are ever visited. The top RELATED_POSTS_LIMIT matches per post
+are stored as RelatedPost rows so the detail endpoint reads them with a
+single prefetch.
+"""
+import heapq
+import math
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Prefetch
+
+from .models import BlogPost, RelatedPost
+from .detail_cache import invalidate_slugs
+
+RELATED_POSTS_LIMIT = 5
+CATEGORY_WEIGHT = 2.0
+
+
+def related_posts_prefetch():
+    """Prefetch for BlogPostDetailSerializer.related_posts: one query for any number of posts"""
+    links = RelatedPost.objects.select_related('related').only(
+        'post', 'rank', 'related__id', 'related__title', 'related__slug',
+        'related__image', 'related__status', 'related__published_at',
+    ).order_by('rank')
+    return Prefetch('related_links', queryset=links)
+
+
+def load_features():
+    """Map each published post id to its {feature: weight}, plus the post slugs"""
+    posts = dict(BlogPost.objects.filter(status='published').values_list('id', 'slug'))
+    features = defaultdict(set)
+    for post_id, category_id in BlogPost.objects.filter(status='published', category__isnull=False).values_list('id', 'category_id'):
+        features[post_id].add(('category', category_id))
+    tagged = BlogPost.tags.through.objects.filter(blogpost__status='published').values_list('blogpost_id', 'blogtag_id')
+    for post_id, tag_id in tagged.iterator():
+        features[post_id].add(('tag', tag_id))
+    
+    frequency = defaultdict(int)
+    for post_features in features.values():
+        for feature in post_features:
+            frequency[feature] += 1
+    
+    total = len(posts)
+    weights = {}
+    for feature, count in frequency.items():
+        weight = math.log(1 + total / count)
+        weights[feature] = weight * CATEGORY_WEIGHT if feature[0] == 'category' else weight
+    
+    vectors = {
+        post_id: {feature: weights[feature] for feature in post_features}
+        for post_id, post_features in features.items()
+    }
+    return vectors, posts
+
+
+def top_related(vectors, post_ids, limit=RELATED_POSTS_LIMIT):
+    """Return {post_id: [(score, related_id), ...]} best first, for each of post_ids"""
+    index = defaultdict(list)
+    for post_id, vector in vectors.items():
+        for feature in vector:
+            index[feature].append(post_id)
+    totals = {post_id: sum(vector.values()) for post_id, vector in vectors.items()}
+    
+    results = {}
+    for post_id in post_ids:
+        vector = vectors.get(post_id)
+        if not vector:
+            results[post_id] = []
+            continue
+        shared = defaultdict(float)
+        for feature, weight in vector.items():
+            for other_id in index[feature]:
+                if other_id != post_id:
+                    shared[other_id] += weight
+        scores = (
+            (overlap / (totals[post_id] + totals[other_id] - overlap), other_id)
+            for other_id, overlap in shared.items()
+        )
+        # Ties go to the newer post (higher id)
+        results[post_id] = heapq.nlargest(limit, scores)
+    return results
+
+
+def build_related_posts(post_ids=None, limit=RELATED_POSTS_LIMIT, batch_size=1000):
+    """
+    Recompute stored related posts for post_ids, or for every post.
+
+    An incremental run also recomputes every post that shares a tag or
+    category with post_ids, since their lists may now include them, and
+    every post that currently links to them, since those lists may now
+    drop them. Returns the number of posts whose links were rewritten.
+    """
+    vectors, slugs = load_features()
+    
+    if post_ids is None:
+        targets = set(slugs)
+    else:
+        changed = set(post_ids)
+        changed_features = set()
+        for post_id in changed:
+            changed_features.update(vectors.get(post_id, ()))
+        targets = changed | {
+            post_id for post_id, vector in vectors.items()
+            if changed_features.intersection(vector)
+        }
+        targets.update(RelatedPost.objects.filter(related_id__in=changed).values_list('post_id', flat=True))
+    
+    related = top_related(vectors, targets & set(slugs), limit)
+    links = [
+        RelatedPost(post_id=post_id, related_id=related_id, score=score, rank=rank)
+        for post_id, matches in related.items()
+        for rank, (score, related_id) in enumerate(matches, start=1)
+    ]
+    
+    with transaction.atomic():
+        stale = RelatedPost.objects.all()
+        if post_ids is not None:
+            stale = stale.filter(post_id__in=targets)
+        stale.delete()
+        RelatedPost.objects.bulk_create(links, batch_size=batch_size)
+    
+    # Stored links are part of the cached detail payload
+    invalidate_slugs(slugs[post_id] for post_id in targets if post_id in slugs)
+    return len(targets)
@@ -0,0 +1,81 @@
+"""
+Scheduled publishing for blog posts.
+
+An editor schedules a post by saving it as a draft with published_at set
+to a future time; BlogPost.save() marks such drafts publish_scheduled.
+A post taken back to draft keeps its past published_at but is not
+marked, so it stays down. publish_due_posts() flips every due scheduled
+draft to published, oldest first, in set-based batches served by the
+partial blog_scheduled_idx index. Queryset updates skip model signals, so
+the caches and counters the signals would normally maintain are brought
+up to date here: the taxonomy counts, slug payloads, and related posts.
+Sitemaps and feeds pick the posts up on their own, through the new
+updated_at.
+"""
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import BlogPost
+from .detail_cache import invalidate_slugs
+from .related import build_related_posts
+from .taxonomy import refresh_category_counts, refresh_tag_counts
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_BATCH_SIZE = 500
+
+
+def due_posts(now):
+    # publish_scheduled implies a draft (BlogPost.save), so status is checked
+    # when publishing rather than here, where it would steer the planner off
+    # blog_scheduled_idx
+    return BlogPost.objects.filter(publish_scheduled=True, published_at__lte=now)
+
+
+def publish_batch(now, batch_size=PUBLISH_BATCH_SIZE):
+    """
+    Publish up to batch_size due drafts. Returns (rows taken, published ids):
+    the first is 0 once nothing is due.
+    """
+    with transaction.atomic():
+        taken = list(
+            due_posts(now).order_by('published_at', 'id')
+            .values_list('id', 'slug', 'category_id', 'status')[:batch_size]
+        )
+        if not taken:
+            return 0, []
+        rows = [(post_id, slug, category_id) for post_id, slug, category_id, status in taken if status == 'draft']
+        post_ids = [post_id for post_id, _, _ in rows]
+        # Re-check the status so a post edited since the SELECT is not overwritten
+        BlogPost.objects.filter(id__in=post_ids, status='draft').update(
+            status='published', publish_scheduled=False, updated_at=now
+        )
+        # Anything left (e.g. a post archived with a queryset update) is no longer due
+        due_posts(now).filter(id__in=[post_id for post_id, *_ in taken]).update(publish_scheduled=False)
+        
+        refresh_category_counts({category_id for _, _, category_id in rows})
+        refresh_tag_counts(
+            BlogPost.tags.through.objects.filter(blogpost_id__in=post_ids).values('blogtag_id')
+        )
+        slugs = [slug for _, slug, _ in rows]
+        transaction.on_commit(lambda: invalidate_slugs(slugs))
+    return len(taken), post_ids
+
+
+def publish_due_posts(now=None, batch_size=PUBLISH_BATCH_SIZE):
+    """Publish every scheduled draft whose published_at has passed; return how many were published"""
+    now = now or timezone.now()
+    published = []
+    while True:
+        taken, post_ids = publish_batch(now, batch_size)
+        if not taken:
+            break
+        published.extend(post_ids)
+        if post_ids:
+            logger.info('Published %d scheduled blog post(s)', len(post_ids))
+    
+    if published:
+        build_related_posts(published)
+    return len(published)
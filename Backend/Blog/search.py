@@ -0,0 +1,232 @@
+"""
+Ranked full-text search over blog posts.
+
+On SQLite this uses the blog_post_fts FTS5 index (see migration
+0003_blogpost_fts) with BM25 ranking, highlighted snippets and keyset
+cursor pagination. Other databases fall back to icontains matching
+ordered by recency.
+"""
+import base64
+import json
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.utils.html import escape
+
+from .models import BlogPost
+
+FTS_TABLE = 'blog_post_fts'
+
+# BM25 column weights: title, description, content, meta_keywords
+BM25_WEIGHTS = (10.0, 4.0, 1.0, 6.0)
+
+# Markers that cannot appear in user content; swapped for <mark> after escaping
+_HIGHLIGHT_OPEN = '\x02'
+_HIGHLIGHT_CLOSE = '\x03'
+
+FTS_TRIGGERS = {
+    'blog_post_fts_ai': """
+        CREATE TRIGGER IF NOT EXISTS blog_post_fts_ai AFTER INSERT ON "Blog_blogpost" BEGIN
+            INSERT INTO blog_post_fts(rowid, title, description, content, meta_keywords)
+            VALUES (new.id, new.title, new.description, new.content, new.meta_keywords);
+        END
+    """,
+    'blog_post_fts_ad': """
+        CREATE TRIGGER IF NOT EXISTS blog_post_fts_ad AFTER DELETE ON "Blog_blogpost" BEGIN
+            INSERT INTO blog_post_fts(blog_post_fts, rowid, title, description, content, meta_keywords)
+            VALUES ('delete', old.id, old.title, old.description, old.content, old.meta_keywords);
+        END
+    """,
+    'blog_post_fts_au': """
+        CREATE TRIGGER IF NOT EXISTS blog_post_fts_au
+        AFTER UPDATE OF title, description, content, meta_keywords ON "Blog_blogpost" BEGIN
+            INSERT INTO blog_post_fts(blog_post_fts, rowid, title, description, content, meta_keywords)
+            VALUES ('delete', old.id, old.title, old.description, old.content, old.meta_keywords);
+            INSERT INTO blog_post_fts(rowid, title, description, content, meta_keywords)
+            VALUES (new.id, new.title, new.description, new.content, new.meta_keywords);
+        END
+    """,
+}
+
+
+def fts_available():
+    return connection.vendor == 'sqlite'
+
+
+def ensure_search_index(**kwargs):
+    """
+    Re-create the FTS sync triggers if missing and rebuild the index.
+    SQLite drops triggers when a migration rebuilds the Blog_blogpost table,
+    so this runs after every migrate.
+    """
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        if cursor.fetchone() is None:
+            return
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+            list(FTS_TRIGGERS),
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        if existing == set(FTS_TRIGGERS):
+            return
+        for sql in FTS_TRIGGERS.values():
+            cursor.execute(sql)
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def build_match_query(query):
+    """
+    Turn free text into a safe FTS5 expression: every word must match,
+    as a prefix. FTS5 operators in the input are treated as plain words.
+    """
+    terms = re.findall(r'\w+', query)
+    return ' '.join('"%s"*' % term for term in terms)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor from a previous page, or None if missing or malformed"""
+    if not cursor:
+        return None
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, TypeError):
+        return None
+
+
+def _is_number(value, types=(int, float)):
+    # bool is an int subclass but never part of a cursor we issued
+    return isinstance(value, types) and not isinstance(value, bool)
+
+
+def _highlight(snippet):
+    return escape(snippet).replace(_HIGHLIGHT_OPEN, '<mark>').replace(_HIGHLIGHT_CLOSE, '</mark>')
+
+
+def search_posts(query, filters, cursor=None, page_size=10):
+    """
+    Return (posts, next_cursor) for one page of results.
+
+    filters may contain status, category (slug), tag (slug), featured and
+    author. Each returned post has `search_rank` and `search_snippet` set.
+    """
+    if fts_available():
+        return _search_fts(query, filters, cursor, page_size)
+    return _search_fallback(query, filters, cursor, page_size)
+
+
+def _search_fts(query, filters, cursor, page_size):
+    match = build_match_query(query)
+    if not match:
+        return [], None
+
+    qn = connection.ops.quote_name
+    post_table = qn(BlogPost._meta.db_table)
+    joins, join_params = [], []
+    where, where_params = [f'{FTS_TABLE} MATCH %s'], [match]
+
+    # Category and tag filters go through the unique slug and M2M indexes
+    if filters.get('category'):
+        category_table = qn(BlogPost._meta.get_field('category').related_model._meta.db_table)
+        joins.append(f'JOIN {category_table} c ON c.id = p.category_id AND c.slug = %s')
+        join_params.append(filters['category'])
+    if filters.get('tag'):
+        tags_field = BlogPost._meta.get_field('tags')
+        through_table = qn(tags_field.remote_field.through._meta.db_table)
+        tag_table = qn(tags_field.related_model._meta.db_table)
+        joins.append(
+            f'JOIN {through_table} pt ON pt.{qn(tags_field.m2m_column_name())} = p.id '
+            f'JOIN {tag_table} t ON t.id = pt.{qn(tags_field.m2m_reverse_name())} AND t.slug = %s'
+        )
+        join_params.append(filters['tag'])
+
+    if filters.get('status'):
+        where.append('p.status = %s')
+        where_params.append(filters['status'])
+    if filters.get('featured') is not None:
+        where.append('p.featured = %s')
+        where_params.append(filters['featured'])
+    if filters.get('author'):
+        where.append('p.author_id = %s')
+        where_params.append(filters['author'])
+    params = join_params + where_params
+
+    weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+    sql = f"""
+        SELECT id, score, snippet FROM (
+            SELECT p.id AS id,
+                   bm25({FTS_TABLE}, {weights}) AS score,
+                   snippet({FTS_TABLE}, -1, char(2), char(3), '…', 24) AS snippet
+            FROM {FTS_TABLE}
+            JOIN {post_table} p ON p.id = {FTS_TABLE}.rowid
+            {' '.join(joins)}
+            WHERE {' AND '.join(where)}
+        )
+    """
+    position = decode_cursor(cursor)
+    # A cursor we issued is [score, id]; anything else starts from the top
+    if (isinstance(position, list) and len(position) == 2
+            and _is_number(position[0]) and _is_number(position[1], int)):
+        sql += ' WHERE (score, id) > (%s, %s)'
+        params.extend(position)
+    sql += ' ORDER BY score, id LIMIT %s'
+    params.append(page_size + 1)
+
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(sql, params)
+        rows = db_cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor([rows[-1][1], rows[-1][0]])
+
+    posts_by_id = BlogPost.objects.select_related('author', 'category').prefetch_related('tags').in_bulk(
+        [row[0] for row in rows]
+    )
+    posts = []
+    for post_id, score, snippet in rows:
+        post = posts_by_id[post_id]
+        post.search_rank = -score
+        post.search_snippet = _highlight(snippet)
+        posts.append(post)
+    return posts, next_cursor
+
+
+def _search_fallback(query, filters, cursor, page_size):
+    queryset = BlogPost.objects.select_related('author', 'category').prefetch_related('tags').filter(
+        Q(title__icontains=query) |
+        Q(description__icontains=query) |
+        Q(content__icontains=query) |
+        Q(meta_keywords__icontains=query)
+    )
+    if filters.get('category'):
+        queryset = queryset.filter(category__slug=filters['category'])
+    if filters.get('tag'):
+        queryset = queryset.filter(tags__slug=filters['tag'])
+    if filters.get('status'):
+        queryset = queryset.filter(status=filters['status'])
+    if filters.get('featured') is not None:
+        queryset = queryset.filter(featured=filters['featured'])
+    if filters.get('author'):
+        queryset = queryset.filter(author_id=filters['author'])
+
+    offset = decode_cursor(cursor) or 0
+    if not _is_number(offset, int) or offset < 0:
+        offset = 0
+    posts = list(queryset.order_by('-created_at', '-id')[offset:offset + page_size + 1])
+    next_cursor = None
+    if len(posts) > page_size:
+        posts = posts[:page_size]
+        next_cursor = encode_cursor(offset + page_size)
+    for post in posts:
+        post.search_rank = None
+        post.search_snippet = escape(post.description[:160])
+    return posts, next_cursor
@@ -1,6 +1,6 @@
 from rest_framework import serializers
-from django.contrib.auth.models import User
 from .models import BlogPost, BlogCategory, BlogTag
+from .authors import get_system_author
 
 
 class UserSerializer(serializers.Serializer):
@@ -54,6 +54,15 @@ class BlogPostListSerializer(serializers.Serializer):
         return BlogTagSerializer(obj.tags.all(), many=True).data
 
 
+class RelatedPostSerializer(serializers.Serializer):
+    """Compact serializer for the related posts listed under a blog post"""
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(max_length=200, read_only=True)
+    slug = serializers.SlugField(max_length=200, read_only=True)
+    image = serializers.ImageField(read_only=True)
+    published_at = serializers.DateTimeField(read_only=True)
+
+
 class BlogPostDetailSerializer(serializers.Serializer):
     """Custom serializer for BlogPost detail view to avoid DRF introspection issues"""
     id = serializers.IntegerField(read_only=True)
@@ -76,11 +85,17 @@ class BlogPostDetailSerializer(serializers.Serializer):
     published_at = serializers.DateTimeField(read_only=True)
     category = BlogCategorySerializer(read_only=True)
     tags = serializers.SerializerMethodField()
+    related_posts = serializers.SerializerMethodField()
     
     def get_tags(self, obj):
         """Get tags as a list of serialized tag data"""
         return BlogTagSerializer(obj.tags.all(), many=True).data
     
+    def get_related_posts(self, obj):
+        """Precomputed related posts (Blog.related), best first; prefetch with related_posts_prefetch()"""
+        related = [link.related for link in obj.related_links.all() if link.related.status == 'published']
+        return RelatedPostSerializer(related, many=True, context=self.context).data
+    
     def get_keywords_list(self, obj):
         """Return meta keywords as a list"""
         return obj.get_keywords_list()
@@ -97,6 +112,11 @@ class BlogPostCreateUpdateSerializer(serializers.Serializer):
     meta_keywords = serializers.CharField(max_length=255, required=False, allow_blank=True)
     status = serializers.ChoiceField(choices=BlogPost.STATUS_CHOICES, default='draft')
     featured = serializers.BooleanField(default=False)
+    published_at = serializers.DateTimeField(
+        required=False,
+        allow_null=True,
+        help_text="For drafts, a future time schedules the post to publish automatically"
+    )
     category_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
     tag_ids = serializers.ListField(
         child=serializers.IntegerField(),
@@ -134,19 +154,7 @@ class BlogPostCreateUpdateSerializer(serializers.Serializer):
         if self.context['request'].user.is_authenticated:
             validated_data['author'] = self.context['request'].user
         else:
-            # Get or create admin user as default author
-            from django.contrib.auth.models import User
-            admin_user, created = User.objects.get_or_create(
-                username='admin',
-                defaults={
-                    'email': 'admin@example.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'is_staff': True,
-                    'is_superuser': True
-                }
-            )
-            validated_data['author'] = admin_user
+            validated_data['author'] = get_system_author()
         
         # Create the blog post
         blog_post = BlogPost.objects.create(**validated_data)
@@ -178,18 +186,7 @@ class BlogPostCreateUpdateSerializer(serializers.Serializer):
         
         # Update author if not authenticated (set to admin)
         if not self.context['request'].user.is_authenticated:
-            from django.contrib.auth.models import User
-            admin_user, created = User.objects.get_or_create(
-                username='admin',
-                defaults={
-                    'email': 'admin@example.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'is_staff': True,
-                    'is_superuser': True
-                }
-            )
-            instance.author = admin_user
+            instance.author = get_system_author()
         
         # Update category if provided
         if category_id is not None:
@@ -222,3 +219,5 @@ class BlogPostSearchSerializer(serializers.Serializer):
     status = serializers.ChoiceField(choices=BlogPost.STATUS_CHOICES, required=False, help_text="Filter by status")
     featured = serializers.BooleanField(required=False, help_text="Filter featured posts")
     author = serializers.IntegerField(required=False, help_text="Filter by author ID")
+    cursor = serializers.CharField(required=False, allow_blank=True, help_text="next_cursor from the previous page")
+    page_size = serializers.IntegerField(required=False, min_value=1, max_value=50, default=10, help_text="Results per page")
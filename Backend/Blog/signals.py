@@ -0,0 +1,111 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .models import BlogPost, BlogCategory, BlogTag
+from .authors import reset_system_author
+from .detail_cache import invalidate_slugs
+from .taxonomy import refresh_tag_counts, refresh_category_counts
+
+
+def invalidate_on_commit(slugs):
+    slugs = list(slugs)
+    transaction.on_commit(lambda: invalidate_slugs(slugs))
+
+
+@receiver(pre_save, sender=BlogPost)
+def remember_previous_state(sender, instance, **kwargs):
+    """Keep the slug, status and category the post had before this save, in case they change"""
+    if instance.pk:
+        previous = BlogPost.objects.filter(pk=instance.pk).values_list('slug', 'status', 'category_id').first()
+        if previous:
+            instance._previous_slug, instance._previous_status, instance._previous_category_id = previous
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def blog_post_changed(sender, instance, **kwargs):
+    invalidate_on_commit([instance.slug, getattr(instance, '_previous_slug', None)])
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def blog_post_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear', 'pre_clear'):
+        return
+    if not reverse:
+        if action != 'pre_clear':
+            invalidate_on_commit([instance.slug])
+    elif action == 'pre_clear':
+        # Reverse clear from a tag: pk_set is not provided, so look the posts up first
+        invalidate_on_commit(instance.blog_posts.values_list('slug', flat=True))
+    elif pk_set:
+        invalidate_on_commit(BlogPost.objects.filter(pk__in=pk_set).values_list('slug', flat=True))
+
+
+@receiver(post_save, sender=BlogTag)
+@receiver(post_save, sender=BlogCategory)
+@receiver(pre_delete, sender=BlogTag)
+@receiver(pre_delete, sender=BlogCategory)
+def blog_taxonomy_changed(sender, instance, **kwargs):
+    """Renamed or removed tags and categories appear in every post that uses them"""
+    invalidate_on_commit(instance.blog_posts.values_list('slug', flat=True))
+
+
+@receiver(post_save, sender=BlogPost)
+def blog_post_counts_changed(sender, instance, created, update_fields=None, **kwargs):
+    """Recount tags and categories when a post enters or leaves 'published' or changes category"""
+    if update_fields is not None and not {'status', 'category'} & set(update_fields):
+        return
+    was_published = getattr(instance, '_previous_status', None) == 'published'
+    is_published = instance.status == 'published'
+    previous_category_id = getattr(instance, '_previous_category_id', None)
+    
+    if was_published != is_published:
+        refresh_category_counts({previous_category_id, instance.category_id})
+        if not created:
+            refresh_tag_counts(instance.tags.values('pk'))
+    elif is_published and previous_category_id != instance.category_id:
+        refresh_category_counts({previous_category_id, instance.category_id})
+
+
+@receiver(pre_delete, sender=BlogPost)
+def remember_published_taxonomy(sender, instance, **kwargs):
+    """Tag links are deleted before post_delete, so note them while they exist"""
+    if instance.status == 'published':
+        instance._published_tag_ids = list(instance.tags.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=BlogPost)
+def blog_post_counts_deleted(sender, instance, **kwargs):
+    if instance.status == 'published':
+        refresh_category_counts([instance.category_id])
+        refresh_tag_counts(getattr(instance, '_published_tag_ids', []))
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def blog_post_tag_counts_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Recount the tags added to or removed from a post. The in-memory status
+    may be an unsaved edit (the API sets tags before saving the post), so
+    the tags are recounted whatever it is; the recount reads the stored
+    status, and a later status change is recounted by post_save.
+    """
+    if reverse:
+        # Posts were added to or removed from a tag; recount just that tag
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            refresh_tag_counts([instance.pk])
+    elif action == 'pre_clear':
+        instance._cleared_tag_ids = list(instance.tags.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        refresh_tag_counts(getattr(instance, '_cleared_tag_ids', []))
+    elif action in ('post_add', 'post_remove') and pk_set:
+        refresh_tag_counts(pk_set)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def system_author_deleted(sender, instance, **kwargs):
+    """Stop handing out the cached system author once its user row is gone"""
+    # The deleted instance loses its pk once the delete finishes
+    pk = instance.pk
+    transaction.on_commit(lambda: reset_system_author(pk))
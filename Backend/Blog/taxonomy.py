@@ -0,0 +1,57 @@
+"""
+Published post counts for blog tags and categories.
+
+BlogTag.published_post_count and BlogCategory.published_post_count are
+denormalized so the sidebar tag cloud is one query instead of a GROUP BY
+over the tag through table per render. Blog.signals keeps them current
+as posts are published, unpublished, archived, re-tagged or deleted; each
+change recounts only the tags and categories it touched, so the counters
+cannot drift.
+"""
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import BlogPost, BlogCategory, BlogTag
+
+
+def _published_count(queryset, group_field):
+    counts = (
+        queryset.filter(**{group_field: OuterRef('pk')})
+        .order_by()
+        .values(group_field)
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def refresh_tag_counts(tag_ids=None):
+    """Recount published posts for the given tags (a list or queryset of ids), or all tags"""
+    tags = BlogTag.objects.all()
+    if tag_ids is not None:
+        tags = tags.filter(pk__in=tag_ids)
+    tagged = BlogPost.tags.through.objects.filter(blogpost__status='published')
+    return tags.update(published_post_count=_published_count(tagged, 'blogtag_id'))
+
+
+def refresh_category_counts(category_ids=None):
+    """Recount published posts for the given categories, or all categories"""
+    categories = BlogCategory.objects.all()
+    if category_ids is not None:
+        categories = categories.filter(pk__in=[pk for pk in category_ids if pk is not None])
+    published = BlogPost.objects.filter(status='published')
+    return categories.update(published_post_count=_published_count(published, 'category_id'))
+
+
+def tag_cloud():
+    """Categories and tags that have published posts, read in a single query"""
+    fields = ('id', 'name', 'slug', 'published_post_count')
+    categories = BlogCategory.objects.filter(published_post_count__gt=0).order_by().values(*fields, kind=Value('category'))
+    tags = BlogTag.objects.filter(published_post_count__gt=0).order_by().values(*fields, kind=Value('tag'))
+    rows = categories.union(tags, all=True).order_by('kind', F('published_post_count').desc(), 'name')
+    
+    cloud = {'categories': [], 'tags': []}
+    for row in rows:
+        kind = row.pop('kind')
+        cloud['categories' if kind == 'category' else 'tags'].append(row)
+    return cloud
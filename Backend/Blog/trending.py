@@ -0,0 +1,59 @@
+"""
+Trending blog posts.
+
+Views (from the Blog.counters flush) and new likes are rolled up per
+post per hour in BlogEngagement. refresh_trending_scores() turns the
+last TRENDING_WINDOW_HOURS of buckets into BlogPost.trending_score:
+
+    score = sum((views + LIKE_WEIGHT * likes) * 0.5 ** (age_hours / TRENDING_HALF_LIFE_HOURS))
+
+so engagement loses half its weight every half-life and an old post
+with a large lifetime view_count does not outrank this week's posts.
+The trending endpoint reads the top posts straight off the
+blog_trending_idx index.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import BlogPost, BlogEngagement
+
+TRENDING_HALF_LIFE_HOURS = 24
+TRENDING_WINDOW_HOURS = 7 * 24
+LIKE_WEIGHT = 5
+ENGAGEMENT_RETENTION_DAYS = 30
+
+
+def trending_scores(now):
+    """Decayed engagement per post id over the trending window"""
+    since = now - timedelta(hours=TRENDING_WINDOW_HOURS)
+    buckets = BlogEngagement.objects.filter(hour__gte=since).values_list('post_id', 'hour', 'views', 'likes')
+    scores = defaultdict(float)
+    for post_id, hour, views, likes in buckets.iterator(chunk_size=5000):
+        age_hours = max((now - hour).total_seconds() / 3600, 0)
+        scores[post_id] += (views + LIKE_WEIGHT * likes) * 0.5 ** (age_hours / TRENDING_HALF_LIFE_HOURS)
+    return scores
+
+
+def refresh_trending_scores(now=None, batch_size=1000):
+    """Recompute and store every post's trending score; return how many posts have one"""
+    now = now or timezone.now()
+    scores = trending_scores(now)
+    with transaction.atomic():
+        # Posts that fell out of the window go back to zero
+        BlogPost.objects.filter(trending_score__gt=0).exclude(pk__in=list(scores)).update(trending_score=0)
+        BlogPost.objects.bulk_update(
+            [BlogPost(pk=post_id, trending_score=score) for post_id, score in scores.items()],
+            ['trending_score'],
+            batch_size=batch_size,
+        )
+    return len(scores)
+
+
+def prune_engagement(now=None, keep_days=ENGAGEMENT_RETENTION_DAYS):
+    """Delete hourly buckets older than keep_days; return how many were deleted"""
+    now = now or timezone.now()
+    deleted, _ = BlogEngagement.objects.filter(hour__lt=now - timedelta(days=keep_days)).delete()
+    return deleted
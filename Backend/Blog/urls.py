@@ -8,8 +8,14 @@ urlpatterns = [
     path('posts/', views.BlogPostListCreateView.as_view(), name='post-list-create'),
     path('posts/search/', views.BlogPostSearchView.as_view(), name='post-search'),
     path('posts/featured/', views.FeaturedBlogPostsView.as_view(), name='post-featured'),
+    path('posts/trending/', views.TrendingBlogPostsView.as_view(), name='post-trending'),
+    path('posts/likes/', views.my_likes, name='post-my-likes'),
     path('posts/<int:id>/', views.BlogPostRetrieveUpdateDestroyView.as_view(), name='post-detail'),
     path('posts/<int:id>/increment-view/', views.increment_view_count, name='post-increment-view'),
+    path('posts/<int:id>/like/', views.like_post, name='post-like'),
     path('posts/<int:id>/increment-like/', views.increment_like_count, name='post-increment-like'),
     path('posts/<int:id>/decrement-like/', views.decrement_like_count, name='post-decrement-like'),
+    # Own prefix, so no slug can collide with the fixed or numeric paths above
+    path('posts/by-slug/<slug:slug>/', views.BlogPostBySlugView.as_view(), name='post-detail-slug'),
+    path('cloud/', views.blog_cloud, name='cloud'),
 ]
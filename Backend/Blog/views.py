@@ -4,10 +4,17 @@ from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnl
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from Backend.api_utils import parse_id_list
 
-from .models import BlogPost, BlogCategory, BlogTag
+from .models import BlogPost, BlogCategory, BlogTag, BlogLike
+from .authors import get_system_author
+from .search import search_posts
+from .listing import post_rows, render_rows
+from .related import related_posts_prefetch
+from .taxonomy import tag_cloud
+from .detail_cache import get_post_payload, set_post_payload
 from .serializers import (
     BlogPostListSerializer, BlogPostDetailSerializer, BlogPostCreateUpdateSerializer,
     BlogCategorySerializer, BlogTagSerializer, BlogPostSearchSerializer
@@ -23,7 +30,22 @@ class AllowPostWithoutAuth(IsAuthenticatedOrReadOnly):
         return True
 
 
-class BlogPostListCreateView(generics.ListCreateAPIView):
+class FastPostListMixin:
+    """
+    Render GET lists with Blog.listing instead of BlogPostListSerializer.
+    The JSON is identical; it is built from values() rows instead of
+    field-by-field serializer calls on model instances.
+    """
+    
+    def list(self, request, *args, **kwargs):
+        rows = post_rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(render_rows(page, request))
+        return Response(render_rows(list(rows), request))
+
+
+class BlogPostListCreateView(FastPostListMixin, generics.ListCreateAPIView):
     """
     GET: List all blog posts
     POST: Create a new blog post
@@ -58,7 +80,7 @@ class BlogPostRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     PUT/PATCH: Update a blog post
     DELETE: Archive a blog post (soft delete)
     """
-    queryset = BlogPost.objects.select_related('author', 'category').prefetch_related('tags')
+    queryset = BlogPost.objects.select_related('author', 'category').prefetch_related('tags', related_posts_prefetch())
     lookup_field = 'id'
     permission_classes = [AllowPostWithoutAuth]
     
@@ -78,7 +100,7 @@ class BlogPostRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         return queryset
     
     def retrieve(self, request, *args, **kwargs):
-        """Increment view count when retrieving a blog post"""
+        """Count a view (buffered, no write on the request path) when retrieving a blog post"""
         instance = self.get_object()
         instance.increment_view_count()
         serializer = self.get_serializer(instance)
@@ -90,85 +112,84 @@ class BlogPostRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         
         # Update author to admin if not authenticated
         if not request.user.is_authenticated:
-            from django.contrib.auth.models import User
-            admin_user, created = User.objects.get_or_create(
-                username='admin',
-                defaults={
-                    'email': 'admin@example.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'is_staff': True,
-                    'is_superuser': True
-                }
-            )
-            instance.author = admin_user
+            instance.author = get_system_author()
         
         instance.status = 'archived'
         instance.save(update_fields=['status', 'author'])
         return Response({'message': 'Blog post archived successfully'}, status=status.HTTP_200_OK)
 
 
+class BlogPostBySlugView(APIView):
+    """
+    GET: Retrieve a published blog post by slug (BlogPost.get_absolute_url)
+    The rendered payload is cached; a hit does no database work. Views are
+    not counted here; clients post to increment-view instead.
+    """
+    permission_classes = [AllowAny]
+    
+    def get(self, request, slug):
+        # Links in the payload are absolute, so they differ per scheme and host
+        origin = f'{request.scheme}://{request.get_host()}'
+        payload = get_post_payload(slug, origin)
+        if payload is None:
+            post = get_object_or_404(
+                BlogPost.objects.select_related('author', 'category').prefetch_related('tags', related_posts_prefetch()),
+                slug=slug,
+                status='published'
+            )
+            data = BlogPostDetailSerializer(post, context={'request': request}).data
+            payload = set_post_payload(post, data, origin)
+        return HttpResponse(payload, content_type='application/json')
+
+
 class BlogPostSearchView(APIView):
     """
     POST: Search blog posts with advanced filters
+    Results are ranked by relevance and paginated with an opaque cursor:
+    pass the returned next_cursor back as `cursor` to get the next page.
     """
     permission_classes = [IsAuthenticatedOrReadOnly]
     
     def post(self, request):
         serializer = BlogPostSearchSerializer(data=request.data)
         if serializer.is_valid():
-            query = serializer.validated_data.get('query', '')
-            category = serializer.validated_data.get('category')
-            tag = serializer.validated_data.get('tag')
-            status_filter = serializer.validated_data.get('status')
-            featured = serializer.validated_data.get('featured')
-            author = serializer.validated_data.get('author')
-            
-            # Build queryset
-            queryset = BlogPost.objects.select_related('author', 'category').prefetch_related('tags')
+            data = serializer.validated_data
+            filters = {
+                'category': data.get('category'),
+                'tag': data.get('tag'),
+                'status': data.get('status'),
+                'featured': data.get('featured'),
+                'author': data.get('author'),
+            }
             
-            # Filter by status for non-authenticated users
+            # Only published posts for non-authenticated users
             if not request.user.is_authenticated:
-                queryset = queryset.filter(status='published')
+                if filters['status'] not in (None, 'published'):
+                    return Response({'results': [], 'count': 0, 'next_cursor': None})
+                filters['status'] = 'published'
             
-            # Apply filters
-            if query:
-                queryset = queryset.filter(
-                    Q(title__icontains=query) |
-                    Q(description__icontains=query) |
-                    Q(content__icontains=query) |
-                    Q(meta_keywords__icontains=query)
-                )
-            
-            if category:
-                queryset = queryset.filter(category__slug=category)
-            
-            if tag:
-                queryset = queryset.filter(tags__slug=tag)
-            
-            if status_filter:
-                queryset = queryset.filter(status=status_filter)
-            
-            if featured is not None:
-                queryset = queryset.filter(featured=featured)
-            
-            if author:
-                queryset = queryset.filter(author_id=author)
+            posts, next_cursor = search_posts(
+                data['query'],
+                filters,
+                cursor=data.get('cursor'),
+                page_size=data.get('page_size', 10)
+            )
             
-            # Order by creation date
-            queryset = queryset.order_by('-created_at')
+            results = BlogPostListSerializer(posts, many=True, context={'request': request}).data
+            for result, post in zip(results, posts):
+                result['rank'] = post.search_rank
+                result['snippet'] = post.search_snippet
             
-            # Serialize results
-            serializer = BlogPostListSerializer(queryset, many=True)
             return Response({
-                'results': serializer.data,
-                'count': queryset.count()
+                'results': results,
+                'count': len(results),
+                'next_cursor': next_cursor
             })
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class FeaturedBlogPostsView(generics.ListAPIView):
+class FeaturedBlogPostsView(FastPostListMixin, generics.ListAPIView):
     """
     GET: List featured blog posts
     """
@@ -177,38 +198,100 @@ class FeaturedBlogPostsView(generics.ListAPIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
 
+class TrendingBlogPostsView(FastPostListMixin, generics.ListAPIView):
+    """
+    GET: Published posts with the highest trending score (Blog.trending)
+    ?limit= sets how many (default 10, at most 50)
+    """
+    permission_classes = [AllowAny]
+    pagination_class = None
+    
+    def get_queryset(self):
+        try:
+            limit = min(max(int(self.request.query_params.get('limit', 10)), 1), 50)
+        except ValueError:
+            limit = 10
+        return BlogPost.objects.filter(
+            status='published', trending_score__gt=0
+        ).order_by('-trending_score', '-id')[:limit]
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def blog_cloud(request):
+    """
+    Categories and tags with their published post counts, for the blog sidebar
+    GET /api/blog/cloud/
+    """
+    return Response(tag_cloud())
 
 
 
 
+def like_owner(request):
+    """The user, or for anonymous visitors the session key, that owns a like"""
+    if request.user.is_authenticated:
+        return request.user, ''
+    if not request.session.session_key:
+        request.session.save()
+    return None, request.session.session_key
+
+
+@api_view(['POST', 'DELETE'])
+@permission_classes([AllowPostWithoutAuth])
+def like_post(request, id):
+    """
+    POST: Like a blog post
+    DELETE: Remove the caller's like
+    Both are idempotent; number_of_likes only moves when the like state changes.
+    """
+    blog_post = get_object_or_404(BlogPost.objects.only('id', 'number_of_likes'), id=id)
+    user, session_key = like_owner(request)
+    
+    if request.method == 'POST':
+        changed = blog_post.add_like(user, session_key)
+    else:
+        changed = blog_post.remove_like(user, session_key)
+    
+    return Response({
+        'liked': request.method == 'POST',
+        'changed': changed,
+        'number_of_likes': blog_post.number_of_likes
+    })
+
+
+@api_view(['GET'])
+@permission_classes([AllowPostWithoutAuth])
+def my_likes(request):
+    """
+    Report which of the given posts the caller has liked
+    GET /api/blog/posts/likes/?post_ids=1,2,3
+    """
+    post_ids = parse_id_list(request, 'post_ids')
+    
+    if request.user.is_authenticated:
+        likes = BlogLike.objects.owned_by(request.user)
+    elif request.session.session_key:
+        likes = BlogLike.objects.owned_by(session_key=request.session.session_key)
+    else:
+        return Response({'liked_post_ids': []})
+    
+    liked = likes.filter(post_id__in=post_ids).values_list('post_id', flat=True)
+    return Response({'liked_post_ids': list(liked)})
+
+
 @api_view(['POST'])
 @permission_classes([AllowPostWithoutAuth])
 def increment_view_count(request, id):
     """
     Increment view count for a specific blog post
     """
-    try:
-        blog_post = get_object_or_404(BlogPost, id=id)
-        
-        if not request.user.is_authenticated:
-            from django.contrib.auth.models import User
-            admin_user, created = User.objects.get_or_create(
-                username='admin',
-                defaults={
-                    'email': 'admin@example.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'is_staff': True,
-                    'is_superuser': True
-                }
-            )
-            blog_post.author = admin_user
-            blog_post.save(update_fields=['author'])
-        
-        blog_post.increment_view_count()
-        return Response({'message': 'View count incremented successfully'})
-    except BlogPost.DoesNotExist:
+    if not BlogPost.objects.filter(id=id).exists():
         return Response({'error': 'Blog post not found'}, status=status.HTTP_404_NOT_FOUND)
+    
+    # Buffered; written as a batched UPDATE by Blog.counters
+    BlogPost(id=id).increment_view_count()
+    return Response({'message': 'View count incremented successfully'})
 
 @api_view(['POST'])
 @permission_classes([AllowPostWithoutAuth])
@@ -216,26 +299,10 @@ def increment_like_count(request, id):
     """
     Increment like count for a specific blog post
     """
-    try:
-        blog_post = get_object_or_404(BlogPost, id=id)
-        if not request.user.is_authenticated:
-            from django.contrib.auth.models import User
-            admin_user, created = User.objects.get_or_create(
-                username='admin',
-                defaults={
-                    'email': 'admin@example.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'is_staff': True,
-                    'is_superuser': True
-                }
-            )
-            blog_post.author = admin_user
-            blog_post.save(update_fields=['author'])
-        blog_post.increment_like_count()
-        return Response({'message': 'Like count incremented successfully'})
-    except BlogPost.DoesNotExist:
-        return Response({'error': 'Blog post not found'}, status=status.HTTP_404_NOT_FOUND)
+    blog_post = get_object_or_404(BlogPost.objects.only('id', 'number_of_likes'), id=id)
+    user, session_key = like_owner(request)
+    blog_post.add_like(user, session_key)
+    return Response({'message': 'Like count incremented successfully'})
 
 @api_view(['POST'])
 @permission_classes([AllowPostWithoutAuth])
@@ -243,25 +310,7 @@ def decrement_like_count(request, id):
     """
     Decrement like count for a specific blog post
     """
-    try:
-        blog_post = get_object_or_404(BlogPost, id=id)
-        if not request.user.is_authenticated:
-            from django.contrib.auth.models import User
-            admin_user, created = User.objects.get_or_create(
-                username='admin',
-                defaults={
-                    'email': 'admin@example.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'is_staff': True,
-                    'is_superuser': True
-                }
-            )
-            blog_post.author = admin_user
-            blog_post.save(update_fields=['author'])
-        if blog_post.number_of_likes > 0:
-            blog_post.number_of_likes -= 1
-            blog_post.save(update_fields=['number_of_likes'])
-        return Response({'message': 'Like count decremented successfully'})
-    except BlogPost.DoesNotExist:
-        return Response({'error': 'Blog post not found'}, status=status.HTTP_404_NOT_FOUND)
+    blog_post = get_object_or_404(BlogPost.objects.only('id', 'number_of_likes'), id=id)
+    user, session_key = like_owner(request)
+    blog_post.remove_like(user, session_key)
+    return Response({'message': 'Like count decremented successfully'})
@@ -30,6 +30,13 @@ class Product(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Product'
         verbose_name_plural = 'Products'
+        indexes = [
+            # Sitemap and feed signatures (count, latest updated_at)
+            models.Index(fields=['updated_at'], condition=models.Q(is_active=True), name='product_active_updated_idx'),
+            # Shop pages (frontendCore.shop), newest first, with and without a category
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(is_active=True), name='product_shop_idx'),
+            models.Index(fields=['category', '-created_at', '-id'], condition=models.Q(is_active=True), name='product_shop_category_idx'),
+        ]
     
     def __str__(self):
         return self.name
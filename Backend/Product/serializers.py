@@ -1,6 +1,20 @@
+from django.db.models import OuterRef, Subquery
 from rest_framework import serializers
 from .models import Product, ProductImage
 
+
+def primary_image_subquery(product_ref='pk'):
+    """
+    Subquery returning the stored path of a product's primary image.
+    Falls back to the oldest image, matching ProductImage ordering.
+    """
+    return Subquery(
+        ProductImage.objects.filter(product=OuterRef(product_ref))
+        .order_by('-is_primary', 'created_at')
+        .values('image')[:1]
+    )
+
+
 class ProductImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProductImage
@@ -22,7 +36,7 @@ class ProductSerializer(serializers.ModelSerializer):
     def get_primary_image(self, obj):
         primary_image = obj.images.filter(is_primary=True).first()
         if primary_image:
-            return ProductImageSerializer(primary_image).data
+            return ProductImageSerializer(primary_image, context=self.context).data
         return None
 
 class ProductListSerializer(serializers.ModelSerializer):
@@ -46,6 +60,30 @@ class ProductListSerializer(serializers.ModelSerializer):
             }
         return None
 
+class ProductSummarySerializer(serializers.ModelSerializer):
+    """
+    Compact product projection for embedding in other resources.
+    Expects the thumbnail path to be annotated as `thumbnail_name`
+    (see primary_image_subquery) so no image query is issued per row.
+    """
+    thumbnail = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Product
+        fields = ['id', 'name', 'slug', 'thumbnail']
+        read_only_fields = fields
+
+    def get_thumbnail(self, obj):
+        name = getattr(obj, 'thumbnail_name', None)
+        if not name:
+            return None
+        url = ProductImage._meta.get_field('image').storage.url(name)
+        # Absolute when there is a request, like DRF's ImageField in ProductSerializer
+        request = self.context.get('request')
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
 class ProductCreateUpdateSerializer(serializers.ModelSerializer):
     images = ProductImageSerializer(many=True, required=False)
     
@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from Backend.caching import bump_version
+
+from .models import Product, ProductImage
+
+# Version namespace for everything cached from the product catalog
+CATALOG_VERSION = 'products'
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def product_catalog_changed(sender, instance, **kwargs):
+    """Any product or image edit invalidates pages cached from the catalog"""
+    transaction.on_commit(lambda: bump_version(CATALOG_VERSION))
@@ -3,6 +3,7 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from .models import Review
+from .moderation import moderate_reviews
 
 
 @admin.register(Review)
@@ -77,7 +78,7 @@ class ReviewAdmin(admin.ModelAdmin):
     
     def soft_delete_selected(self, request, queryset):
         """Custom action to soft delete selected reviews"""
-        updated = queryset.update(is_archived=True)
+        updated = moderate_reviews(queryset, 'archive')
         self.message_user(
             request, 
             f'{updated} review(s) were successfully archived.'
@@ -86,14 +87,23 @@ class ReviewAdmin(admin.ModelAdmin):
     
     def restore_selected(self, request, queryset):
         """Custom action to restore selected reviews"""
-        updated = queryset.update(is_archived=False)
+        updated = moderate_reviews(queryset, 'restore')
         self.message_user(
             request, 
             f'{updated} review(s) were successfully restored.'
         )
     restore_selected.short_description = "Restore selected reviews"
     
-    actions = [soft_delete_selected, restore_selected]
+    def verify_selected(self, request, queryset):
+        """Custom action to mark selected reviews as verified purchases"""
+        updated = moderate_reviews(queryset, 'verify')
+        self.message_user(
+            request, 
+            f'{updated} review(s) were marked as verified purchases.'
+        )
+    verify_selected.short_description = "Mark selected reviews as verified purchases"
+    
+    actions = [soft_delete_selected, restore_selected, verify_selected]
     
     def has_delete_permission(self, request, obj=None):
         """Prevent hard deletion in admin"""
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.lookups import GreaterThanOrEqual
+from django.utils import timezone
+
+from Review.models import Review, helpfulness_decay_sql
+
+
+class Command(BaseCommand):
+    """
+    Nightly job: age every non-zero helpfulness score to the current time.
+
+    Votes already update their own review's score, so this only applies the
+    decay that accrued since. The decay depends only on score_updated_at, so
+    the whole job is a single UPDATE run by the database.
+    """
+    help = 'Decay review helpfulness scores to the current time'
+
+    # Scores below this are treated as zero so old rows drop out of later runs
+    MIN_SCORE = 0.01
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        decayed = F('helpfulness_score') * helpfulness_decay_sql(now)
+        updated = Review.objects.filter(helpfulness_score__gt=0).update(
+            helpfulness_score=Case(
+                When(GreaterThanOrEqual(decayed, self.MIN_SCORE), then=decayed),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+            score_updated_at=now,
+        )
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed helpfulness scores for {updated} review(s)'))
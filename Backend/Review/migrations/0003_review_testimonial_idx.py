@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-19 04:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product', '0001_initial'),
+        ('Review', '0002_reviewvote'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['is_archived', '-rating', '-is_helpful', '-created_at'], name='review_testimonial_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.6 on 2026-10-19 04:47
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+def seed_helpfulness_score(apps, schema_editor):
+    """Start existing reviews with their raw helpful count as the score"""
+    Review = apps.get_model('Review', 'Review')
+    Review.objects.filter(is_helpful__gt=0).update(
+        helpfulness_score=F('is_helpful'),
+        score_updated_at=timezone.now(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Product', '0001_initial'),
+        ('Review', '0003_review_testimonial_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='review',
+            name='review_testimonial_idx',
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='helpfulness_score',
+            field=models.FloatField(default=0, help_text='Time-decayed helpful votes, used for ordering=helpful'),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='score_updated_at',
+            field=models.DateTimeField(blank=True, help_text='Time helpfulness_score was last decayed to', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['-rating', '-is_helpful', '-created_at'], name='review_testimonial_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['-helpfulness_score', '-created_at'], name='review_helpful_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['product', '-helpfulness_score', '-created_at'], name='review_product_helpful_idx'),
+        ),
+        migrations.RunPython(seed_helpfulness_score, migrations.RunPython.noop),
+    ]
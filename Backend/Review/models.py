@@ -1,10 +1,35 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, F, Func, Value, When
+from django.db.models.functions import Greatest, Power
 from django.conf import settings
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from Product.models import Product
+from Backend.db_utils import insert_ignore
 
 # Create your models here.
 
+# Helpful votes lose half their weight every HELPFULNESS_HALF_LIFE_DAYS
+HELPFULNESS_HALF_LIFE_DAYS = 30
+
+
+def helpfulness_decay_sql(now):
+    """
+    Database expression for the multiplier that ages a row's helpfulness
+    score from its score_updated_at to `now` (1.0 if it was never scored)
+    """
+    elapsed_days = Greatest(
+        Func(Value(now, output_field=models.DateTimeField()), function='julianday', output_field=models.FloatField())
+        - Func(F('score_updated_at'), function='julianday', output_field=models.FloatField()),
+        Value(0.0),
+    )
+    return Case(
+        When(score_updated_at__isnull=True, then=Value(1.0)),
+        default=Power(Value(0.5), elapsed_days / HELPFULNESS_HALF_LIFE_DAYS),
+        output_field=models.FloatField(),
+    )
+
+
 class Review(models.Model):
     """Model for product reviews with soft delete functionality"""
     
@@ -31,6 +56,15 @@ class Review(models.Model):
     is_archived = models.BooleanField(default=False, help_text="Soft delete flag")
     is_verified_purchase = models.BooleanField(default=False, help_text="Whether user purchased this product")
     is_helpful = models.PositiveIntegerField(default=0, help_text="Number of helpful votes")
+    helpfulness_score = models.FloatField(
+        default=0,
+        help_text="Time-decayed helpful votes, used for ordering=helpful"
+    )
+    score_updated_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Time helpfulness_score was last decayed to"
+    )
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -42,6 +76,27 @@ class Review(models.Model):
         verbose_name_plural = 'Reviews'
         # Ensure one review per user per product
         unique_together = ['product', 'user']
+        # Partial indexes on active reviews: SQLite compiles is_archived=False
+        # as NOT "is_archived", which only matches an index with that condition
+        indexes = [
+            # Home page testimonial selection
+            models.Index(
+                fields=['-rating', '-is_helpful', '-created_at'],
+                condition=models.Q(is_archived=False),
+                name='review_testimonial_idx',
+            ),
+            # ordering=helpful, across all products and per product
+            models.Index(
+                fields=['-helpfulness_score', '-created_at'],
+                condition=models.Q(is_archived=False),
+                name='review_helpful_idx',
+            ),
+            models.Index(
+                fields=['product', '-helpfulness_score', '-created_at'],
+                condition=models.Q(is_archived=False),
+                name='review_product_helpful_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.product.name} ({self.rating} stars)"
@@ -56,6 +111,31 @@ class Review(models.Model):
         self.is_archived = False
         self.save(update_fields=['is_archived'])
     
+    def add_helpful_vote(self, user):
+        """
+        Record a helpful vote from user. The vote row is inserted with
+        ON CONFLICT DO NOTHING so repeat votes are ignored, and the counter
+        only moves when a row was actually inserted.
+        Returns True if the vote was counted.
+        """
+        with transaction.atomic():
+            if not ReviewVote.insert_ignore(review=self, user=user):
+                return False
+            
+            # Age the stored score to now and add this vote's full weight in
+            # one UPDATE, so concurrent votes cannot read a stale timestamp
+            now = timezone.now()
+            Review.objects.filter(pk=self.pk).update(
+                is_helpful=F('is_helpful') + 1,
+                helpfulness_score=F('helpfulness_score') * helpfulness_decay_sql(now) + 1,
+                score_updated_at=now,
+            )
+        self.refresh_from_db(fields=['is_helpful', 'helpfulness_score', 'score_updated_at'])
+        
+        from .testimonials import invalidate_testimonials
+        invalidate_testimonials()
+        return True
+    
     @property
     def rating_display(self):
         """Return rating as star display"""
@@ -84,4 +164,26 @@ class ReviewImage(models.Model):
         verbose_name_plural = 'Review Images'
 
     def __str__(self):
-        return f"{self.review.user.username} - {self.review.product.name} - Image {self.id}"
\ No newline at end of file
+        return f"{self.review.user.username} - {self.review.product.name} - Image {self.id}"
+
+
+class ReviewVote(models.Model):
+    """A user's helpful vote on a review, at most one per user per review"""
+    review = models.ForeignKey(Review, related_name='votes', on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='review_votes', on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Review Vote'
+        verbose_name_plural = 'Review Votes'
+        constraints = [
+            models.UniqueConstraint(fields=['review', 'user'], name='unique_review_vote'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - review {self.review_id}"
+
+    @classmethod
+    def insert_ignore(cls, review, user):
+        """Insert a vote unless one exists; returns True if a row was inserted"""
+        return insert_ignore(cls, review=review, user=user)
@@ -0,0 +1,32 @@
+"""
+Set-based review moderation shared by the admin actions and the API.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Review
+from .testimonials import invalidate_testimonials
+
+MODERATION_ACTIONS = {
+    'archive': {'is_archived': True},
+    'restore': {'is_archived': False},
+    'verify': {'is_verified_purchase': True},
+}
+
+
+def moderate_reviews(queryset, action):
+    """
+    Apply a moderation action to every review in queryset with one UPDATE.
+    Derived review state (the cached testimonials) is refreshed once the
+    transaction commits. Returns the number of reviews updated.
+    """
+    values = MODERATION_ACTIONS[action]
+    with transaction.atomic():
+        updated = queryset.update(updated_at=timezone.now(), **values)
+        transaction.on_commit(invalidate_testimonials)
+    return updated
+
+
+def moderate_review_ids(review_ids, action):
+    """Apply a moderation action to the reviews with the given ids"""
+    return moderate_reviews(Review.objects.filter(id__in=review_ids), action)
@@ -1,7 +1,10 @@
 from rest_framework import serializers
-from django.contrib.auth.models import User
+from django.contrib.auth import get_user_model
 from .models import Review
-from Product.serializers import ProductSerializer
+from .moderation import MODERATION_ACTIONS
+from Product.serializers import ProductSerializer, ProductSummarySerializer
+
+User = get_user_model()
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for User model in reviews"""
@@ -15,7 +18,7 @@ class ReviewSerializer(serializers.ModelSerializer):
     """Serializer for Review model with full CRUD operations"""
     
     user = UserSerializer(read_only=True)
-    product = ProductSerializer(read_only=True)
+    product = serializers.SerializerMethodField()
     product_id = serializers.IntegerField(write_only=True)
     rating_display = serializers.CharField(read_only=True)
     is_active = serializers.BooleanField(read_only=True)
@@ -29,6 +32,27 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'user', 'created_at', 'updated_at', 'is_helpful']
     
+    def expand_product(self):
+        """Whether the caller asked for the full product with ?expand=product"""
+        request = self.context.get('request')
+        if request is None:
+            return False
+        return 'product' in request.query_params.get('expand', '').split(',')
+    
+    def get_product(self, obj):
+        """Return a compact product summary unless the full product was requested"""
+        if self.expand_product():
+            return ProductSerializer(obj.product, context=self.context).data
+        
+        product = obj.product
+        if hasattr(obj, 'product_thumbnail_name'):
+            product.thumbnail_name = obj.product_thumbnail_name
+        else:
+            product.thumbnail_name = product.images.order_by(
+                '-is_primary', 'created_at'
+            ).values_list('image', flat=True).first()
+        return ProductSummarySerializer(product, context=self.context).data
+    
     def validate_rating(self, value):
         """Validate rating is between 1 and 5"""
         if value < 1 or value > 5:
@@ -232,3 +256,14 @@ class ReviewListSerializer(serializers.ModelSerializer):
             'id', 'user', 'rating', 'rating_display', 'title', 'comment',
             'is_verified_purchase', 'is_helpful', 'created_at'
         ]
+
+
+class ReviewModerationSerializer(serializers.Serializer):
+    """Serializer for bulk moderation requests"""
+    
+    action = serializers.ChoiceField(choices=sorted(MODERATION_ACTIONS))
+    review_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=1000
+    )
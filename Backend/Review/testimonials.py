@@ -0,0 +1,47 @@
+"""
+Testimonial selection for the home page.
+
+The home page shows a fixed number of the best reviews. The rendered
+fragment is cached and dropped whenever reviews change, so the home page
+costs the same no matter how many reviews exist.
+"""
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from Backend.caching import bump_version
+
+from .models import Review
+
+TESTIMONIALS_LIMIT = 6
+TESTIMONIALS_CACHE_KEY = 'review:testimonials:html'
+TESTIMONIALS_CACHE_TIMEOUT = 60 * 60
+# Version namespace for pages that embed the fragment (frontendCore.middleware)
+TESTIMONIALS_VERSION = 'testimonials'
+
+
+def select_testimonials(limit=TESTIMONIALS_LIMIT):
+    """
+    Top reviews by rating, helpfulness and recency.
+    Served by the review_testimonial_idx index, so only `limit` rows are read.
+    """
+    return list(
+        Review.objects.filter(is_archived=False)
+        .select_related('user')
+        .order_by('-rating', '-is_helpful', '-created_at')[:limit]
+    )
+
+
+def render_testimonials():
+    """Return the rendered testimonials fragment, rendering it on a cache miss"""
+    html = cache.get(TESTIMONIALS_CACHE_KEY)
+    if html is None:
+        html = render_to_string('Includes/testimonials.html', {'reviews': select_testimonials()})
+        cache.set(TESTIMONIALS_CACHE_KEY, html, TESTIMONIALS_CACHE_TIMEOUT)
+    return mark_safe(html)
+
+
+def invalidate_testimonials():
+    """Drop the cached fragment so the next home page render rebuilds it"""
+    cache.delete(TESTIMONIALS_CACHE_KEY)
+    bump_version(TESTIMONIALS_VERSION)
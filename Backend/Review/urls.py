@@ -28,6 +28,16 @@ urlpatterns = [
          views.mark_review_helpful, 
          name='mark-review-helpful'),
     
+    # Caller's helpful votes for a page of reviews
+    path('my-votes/', 
+         views.my_review_votes, 
+         name='my-review-votes'),
+    
+    # Bulk moderation (staff only)
+    path('moderate/', 
+         views.moderate_reviews, 
+         name='moderate-reviews'),
+    
     # User's own reviews
     path('my-reviews/', 
          views.UserReviewListView.as_view(), 
@@ -1,19 +1,43 @@
 from rest_framework import generics, status, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from django.shortcuts import get_object_or_404
 from django.db.models import Q, Avg, Count
-from django.contrib.auth.models import User
+from Backend.api_utils import parse_id_list
 
-from .models import Review
+from .models import Review, ReviewVote
+from .moderation import moderate_review_ids
 from .serializers import (
     ReviewSerializer, 
     ReviewCreateSerializer, 
     ReviewUpdateSerializer, 
-    ReviewListSerializer
+    ReviewListSerializer,
+    ReviewModerationSerializer
 )
 from Product.models import Product
+from Product.serializers import primary_image_subquery
+
+
+def with_product_summary(queryset):
+    """
+    Load everything ReviewSerializer needs for its product summary in a
+    single query: the user and product rows plus the product thumbnail path.
+    """
+    return queryset.select_related('user', 'product').annotate(
+        product_thumbnail_name=primary_image_subquery('product_id')
+    )
+
+
+def order_reviews(queryset, ordering):
+    """
+    Apply the ?ordering= query parameter.
+    'helpful' reads the precomputed, indexed helpfulness score; anything
+    else keeps newest first.
+    """
+    if ordering == 'helpful':
+        return queryset.order_by('-helpfulness_score', '-created_at')
+    return queryset.order_by('-created_at')
 
 
 class ReviewListCreateView(generics.ListCreateAPIView):
@@ -51,7 +75,7 @@ class ReviewListCreateView(generics.ListCreateAPIView):
         if verified and verified.lower() == 'true':
             queryset = queryset.filter(is_verified_purchase=True)
         
-        return queryset
+        return order_reviews(queryset, self.request.query_params.get('ordering'))
     
     def list(self, request, *args, **kwargs):
         """Get all reviews for a product with additional statistics"""
@@ -107,6 +131,7 @@ class ReviewListCreateView(generics.ListCreateAPIView):
         if serializer.is_valid():
             review = serializer.save()
             # Return full review data
+            review = with_product_summary(Review.objects.all()).get(pk=review.pk)
             full_serializer = ReviewSerializer(review, context={'request': request})
             return Response(full_serializer.data, status=status.HTTP_201_CREATED)
         
@@ -129,22 +154,21 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         """Get reviews for the product"""
         product_id = self.kwargs.get('product_id')
-        return Review.objects.filter(
+        queryset = with_product_summary(Review.objects.filter(
             product_id=product_id,
             is_archived=False
-        ).select_related('user', 'product')
+        ))
+        
+        # Full product expansion needs the product images
+        if 'product' in self.request.query_params.get('expand', '').split(','):
+            queryset = queryset.prefetch_related('product__images')
+        return queryset
     
     def get_object(self):
         """Get the review object"""
         review_id = self.kwargs.get('review_id')
-        product_id = self.kwargs.get('product_id')
         
-        return get_object_or_404(
-            Review,
-            id=review_id,
-            product_id=product_id,
-            is_archived=False
-        )
+        return get_object_or_404(self.get_queryset(), id=review_id)
     
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific review"""
@@ -178,6 +202,7 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
         if serializer.is_valid():
             serializer.save()
             # Return full review data
+            review = self.get_object()
             full_serializer = ReviewSerializer(review, context={'request': request})
             return Response(full_serializer.data)
         
@@ -223,7 +248,8 @@ class AllReviewsListView(generics.ListAPIView):
         """Get all reviews, optionally filtered"""
         queryset = Review.objects.filter(
             is_archived=False
-        ).select_related('user', 'product').order_by('-created_at')
+        ).select_related('user', 'product')
+        queryset = order_reviews(queryset, self.request.query_params.get('ordering'))
         
         # Optional filtering by rating
         rating = self.request.query_params.get('rating', None)
@@ -270,7 +296,7 @@ class UserReviewListView(generics.ListAPIView):
 @permission_classes([IsAuthenticated])
 def mark_review_helpful(request, product_id, review_id):
     """
-    Mark a review as helpful
+    Mark a review as helpful (one vote per user per review)
     """
     try:
         review = Review.objects.get(
@@ -279,12 +305,11 @@ def mark_review_helpful(request, product_id, review_id):
             is_archived=False
         )
         
-        # Increment helpful count
-        review.is_helpful += 1
-        review.save(update_fields=['is_helpful'])
+        counted = review.add_helpful_vote(request.user)
         
         return Response({
-            'message': 'Review marked as helpful',
+            'message': 'Review marked as helpful' if counted else 'You have already marked this review as helpful',
+            'counted': counted,
             'helpful_count': review.is_helpful
         }, status=status.HTTP_200_OK)
         
@@ -295,6 +320,45 @@ def mark_review_helpful(request, product_id, review_id):
         )
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def my_review_votes(request):
+    """
+    Report which of the given reviews the caller has marked as helpful
+    GET /api/reviews/my-votes/?review_ids=1,2,3
+    """
+    review_ids = parse_id_list(request, 'review_ids')
+    
+    voted = ReviewVote.objects.filter(
+        user=request.user,
+        review_id__in=review_ids
+    ).values_list('review_id', flat=True)
+    
+    return Response({'voted_review_ids': list(voted)})
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def moderate_reviews(request):
+    """
+    Archive, restore or verify many reviews with one UPDATE
+    POST /api/reviews/moderate/
+    Body: {"action": "archive", "review_ids": [1, 2, 3]}
+    """
+    serializer = ReviewModerationSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    updated = moderate_review_ids(
+        serializer.validated_data['review_ids'],
+        serializer.validated_data['action']
+    )
+    return Response({
+        'message': f'{updated} review(s) updated',
+        'updated': updated
+    }, status=status.HTTP_200_OK)
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def product_review_stats(request, product_id):
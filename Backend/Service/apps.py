@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class ServiceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Service'
-    verbose_name = 'Services'
\ No newline at end of file
+    verbose_name = 'Services'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,67 @@
+"""
+Service cards: the service projection shared by the home page, the
+services page and the service cards API.
+
+Cards are built from one query for the services and one Prefetch for
+all their images in display order, then memoized per catalog version
+(see Service.signals), so page renders normally read them from the
+cache without touching the database.
+"""
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from Backend.caching import get_version
+
+from .models import Service, ServiceImage
+from .signals import CATALOG_VERSION
+
+SERVICE_CARDS_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def ordered_images_prefetch():
+    """Service images in display order, loaded for all services in one query"""
+    return Prefetch('images', queryset=ServiceImage.objects.order_by('order', 'created_at'))
+
+
+def service_card(service):
+    """Card dict for a service fetched with ordered_images_prefetch()"""
+    images = list(service.images.all())
+    first = images[0] if images else None
+    return {
+        'id': service.id,
+        'name': service.name,
+        'slug': service.slug,
+        'description': service.description,
+        'meta_description': service.meta_description,
+        'image': {
+            'image': first.image.url if first else None,
+            'alt_text': first.alt_text if first else service.name
+        },
+        'images': [
+            {
+                'id': img.id,
+                'image': img.image.url,
+                'alt_text': img.alt_text or service.name,
+                'order': img.order
+            }
+            for img in images
+        ],
+        'category': 'dental_services',
+        'is_active': service.is_active,
+        'is_featured': service.is_featured,
+        'is_new': service.is_new,
+        'created_at': service.created_at.isoformat()
+    }
+
+
+def service_cards(limit=None):
+    """Cards for active services, newest first, at most limit of them"""
+    key = f'services:cards:{get_version(CATALOG_VERSION)}:{limit}'
+    cards = cache.get(key)
+    if cards is None:
+        services = Service.objects.filter(is_active=True).prefetch_related(ordered_images_prefetch()).order_by('-created_at')
+        if limit is not None:
+            services = services[:limit]
+        cards = [service_card(service) for service in services]
+        cache.set(key, cards, SERVICE_CARDS_CACHE_TIMEOUT)
+    return cards
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-19 04:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Service', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['updated_at'], name='service_active_updated_idx'),
+        ),
+    ]
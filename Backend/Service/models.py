@@ -19,6 +19,10 @@ class Service(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Service'
         verbose_name_plural = 'Services'
+        indexes = [
+            # Sitemap and feed signatures (count, latest updated_at)
+            models.Index(fields=['updated_at'], condition=models.Q(is_active=True), name='service_active_updated_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from Backend.caching import bump_version
+
+from .models import Service, ServiceImage
+
+# Version namespace for everything cached from the service catalog
+CATALOG_VERSION = 'services'
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=ServiceImage)
+@receiver(post_delete, sender=ServiceImage)
+def service_catalog_changed(sender, instance, **kwargs):
+    """Any service or image edit invalidates the cached service responses"""
+    transaction.on_commit(lambda: bump_version(CATALOG_VERSION))
@@ -6,4 +6,5 @@ app_name = 'service_api'
 urlpatterns = [
     # Service endpoint
     path('services/', views.ServiceListView.as_view(), name='service-list'),
+    path('services/cards/', views.service_card_list, name='service-cards'),
 ]
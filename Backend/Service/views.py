@@ -1,10 +1,78 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.http import HttpResponse
 from rest_framework import generics
+from rest_framework.decorators import api_view
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from Backend.caching import get_version
+
+from .cards import ordered_images_prefetch, service_cards
 from .models import Service
 from .serializers import ServiceSerializer
+from .signals import CATALOG_VERSION
+
+SERVICE_LIST_CACHE_TIMEOUT = 24 * 60 * 60
+
 
 class ServiceListView(generics.ListAPIView):
     """
     Get all active services
+    The encoded response is cached per catalog version (see Service.signals),
+    so a hit returns stored bytes without touching the database.
+    """
+    queryset = Service.objects.filter(is_active=True).prefetch_related(ordered_images_prefetch()).order_by('-created_at')
+    serializer_class = ServiceSerializer
+    
+    def cache_page_number(self, request):
+        """
+        The page number the request selects, or None if the response must not
+        be cached: other query parameters (they are echoed in the page links)
+        or a page that does not exist (a 404).
+        """
+        page_param = self.paginator.page_query_param
+        if any(name != page_param for name in request.GET):
+            return None
+        key = f'services:list-pages:{get_version(CATALOG_VERSION)}'
+        pages = cache.get(key)
+        if pages is None:
+            pages = Paginator(self.get_queryset(), self.paginator.page_size).num_pages
+            cache.set(key, pages, SERVICE_LIST_CACHE_TIMEOUT)
+        number = request.GET.get(page_param, 1)
+        if number in self.paginator.last_page_strings:
+            return pages
+        try:
+            number = int(number)
+        except ValueError:
+            return None
+        return number if 1 <= number <= pages else None
+    
+    def list(self, request, *args, **kwargs):
+        number = self.cache_page_number(request)
+        if number is None:
+            return super().list(request, *args, **kwargs)
+        # Paginated links and image URLs are absolute, so the origin is part of the key
+        key = 'services:list:{}:{}://{}:{}'.format(
+            get_version(CATALOG_VERSION), request.scheme, request.get_host(), number
+        )
+        payload = cache.get(key)
+        if payload is None:
+            response = super().list(request, *args, **kwargs)
+            payload = JSONRenderer().render(response.data)
+            cache.set(key, payload, SERVICE_LIST_CACHE_TIMEOUT)
+        return HttpResponse(payload, content_type='application/json')
+
+
+
+@api_view(['GET'])
+def service_card_list(request):
+    """
+    Service cards as used by the home and services pages (see Service.cards)
+    GET /api/services/cards/?limit=3
     """
-    queryset = Service.objects.filter(is_active=True).order_by('-created_at')
-    serializer_class = ServiceSerializer
\ No newline at end of file
+    try:
+        limit = int(request.query_params['limit'])
+    except (KeyError, ValueError):
+        limit = None
+    return Response(service_cards(limit if limit and limit > 0 else None))
@@ -1,3 +1,17 @@
 from django.contrib import admin
+from .models import SlotCapacity, OutboundEmail
 
-# Register your models here.
+
+@admin.register(SlotCapacity)
+class SlotCapacityAdmin(admin.ModelAdmin):
+    list_display = ['service', 'weekday', 'capacity']
+    list_filter = ['service', 'weekday']
+    list_editable = ['capacity']
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'recipient', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['recipient', 'subject']
+    readonly_fields = ['attempts', 'claimed_by', 'last_error', 'created_at', 'sent_at']
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+app_name = 'appointments_api'
+
+urlpatterns = [
+    path('availability/', views.appointment_availability, name='availability'),
+    path('calendar/', views.appointment_calendar, name='calendar'),
+    path('calendar.ics', views.appointment_calendar_ics, name='calendar-ics'),
+]
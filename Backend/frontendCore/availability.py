@@ -0,0 +1,130 @@
+"""
+Appointment slot availability and reservation.
+
+The clinic books fixed SLOT_TIMES each day. Capacity is per service:
+each service has its own number of places in a slot, from the most
+specific SlotCapacity rule for the service and weekday, and only that
+service's bookings count against it. Rules are cached per version and
+change rarely. Availability of a service for any date range is one
+aggregated query over the appointment_slot_idx index, returned as an
+array of remaining places per day, aligned with SLOT_TIMES.
+
+reserve_appointment() writes and locks the slot's AppointmentSlot row,
+recounts the service's bookings in the slot and inserts the appointment
+in one transaction, so two clients cannot take the last place at the
+same time.
+"""
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from Backend.caching import get_version
+from Backend.db_utils import insert_ignore
+
+from .models import Appointment, AppointmentSlot, SlotCapacity
+
+SLOT_TIMES = tuple(time(hour, minute) for hour, minute in (
+    (9, 0), (9, 30), (10, 0), (10, 30), (11, 0), (11, 30), (12, 0),
+    (14, 0), (14, 30), (15, 0), (15, 30), (16, 0), (16, 30), (17, 0),
+))
+MAX_AVAILABILITY_DAYS = 62
+
+# Version namespace for the cached capacity rules
+CAPACITY_VERSION = 'appointment-capacity'
+CAPACITY_RULES_TIMEOUT = 24 * 60 * 60
+
+
+class SlotUnavailable(Exception):
+    """The requested slot does not exist, is in the past or is full"""
+
+
+def capacity_rules():
+    """[(service, weekday, capacity)], cached until a SlotCapacity changes"""
+    key = f'appointments:capacity:{get_version(CAPACITY_VERSION)}'
+    rules = cache.get(key)
+    if rules is None:
+        rules = list(SlotCapacity.objects.values_list('service', 'weekday', 'capacity'))
+        cache.set(key, rules, CAPACITY_RULES_TIMEOUT)
+    return rules
+
+
+def slot_capacity(service, weekday, rules):
+    """Capacity of a slot for service on weekday: service and weekday rules beat generic ones"""
+    best, best_rank = settings.APPOINTMENT_SLOT_CAPACITY, -1
+    for rule_service, rule_weekday, capacity in rules:
+        if rule_service and rule_service != service:
+            continue
+        if rule_weekday is not None and rule_weekday != weekday:
+            continue
+        rank = 2 * bool(rule_service) + (rule_weekday is not None)
+        if rank > best_rank:
+            best, best_rank = capacity, rank
+    return best
+
+
+def booked_counts(date_from, date_to, service):
+    """{(date, time): active bookings of service} for the range, in one aggregated query"""
+    rows = (
+        Appointment.objects
+        .filter(
+            appointment_date__range=(date_from, date_to),
+            service=service,
+            status__in=Appointment.ACTIVE_STATUSES,
+        )
+        .order_by()
+        .values_list('appointment_date', 'appointment_time')
+        .annotate(booked=Count('id'))
+    )
+    return {(day, slot): booked for day, slot, booked in rows}
+
+
+def availability(date_from, date_to, service):
+    """{date: [remaining places for service per SLOT_TIMES entry]} for every day in the range"""
+    rules = capacity_rules()
+    booked = booked_counts(date_from, date_to, service)
+    now = timezone.localtime()
+    
+    days = {}
+    day = date_from
+    while day <= date_to:
+        capacity = slot_capacity(service, day.weekday(), rules)
+        days[day] = [
+            0 if datetime.combine(day, slot) <= now.replace(tzinfo=None)
+            else max(capacity - booked.get((day, slot), 0), 0)
+            for slot in SLOT_TIMES
+        ]
+        day += timedelta(days=1)
+    return days
+
+
+def reserve_appointment(**fields):
+    """
+    Create an Appointment if its slot has room; raise SlotUnavailable if not.
+    fields are Appointment fields; appointment_date and appointment_time
+    must already be date and time objects.
+    """
+    day, slot, service = fields['appointment_date'], fields['appointment_time'], fields['service']
+    if slot not in SLOT_TIMES:
+        raise SlotUnavailable('Please choose one of the listed appointment times.')
+    if datetime.combine(day, slot) <= timezone.localtime().replace(tzinfo=None):
+        raise SlotUnavailable('Please choose a time in the future.')
+    
+    capacity = slot_capacity(service, day.weekday(), capacity_rules())
+    with transaction.atomic():
+        # Serialises bookings of the slot until commit. On SQLite the write
+        # itself does it: it takes the database write lock, which is held
+        # to the end of the transaction (select_for_update is a no-op there).
+        # On databases with row locks the select_for_update does it.
+        insert_ignore(AppointmentSlot, date=day, time=slot)
+        AppointmentSlot.objects.select_for_update().get(date=day, time=slot)
+        booked = Appointment.objects.filter(
+            appointment_date=day, appointment_time=slot, service=service,
+            status__in=Appointment.ACTIVE_STATUSES
+        ).count()
+        if booked >= capacity:
+            raise SlotUnavailable('This time slot is fully booked. Please choose another time.')
+        return Appointment.objects.create(**fields)
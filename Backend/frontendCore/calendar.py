@@ -0,0 +1,119 @@
+"""
+Streaming appointment calendar exports for staff.
+
+Rows are read with values().iterator() and written out as they arrive,
+as JSON or as an iCalendar (RFC 5545) file, so a year of bookings is
+exported in constant memory: no model instances are built and no full
+document is ever held in memory.
+"""
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.utils import timezone
+
+from .models import Appointment
+
+CALENDAR_FIELDS = (
+    'id', 'appointment_date', 'appointment_time', 'service', 'status',
+    'first_name', 'last_name', 'email', 'phone', 'message',
+)
+MAX_CALENDAR_DAYS = 366
+# Slots are half an hour apart
+APPOINTMENT_DURATION = timedelta(minutes=30)
+
+ICS_STATUS = {
+    'pending': 'TENTATIVE',
+    'confirmed': 'CONFIRMED',
+    'completed': 'CONFIRMED',
+    'cancelled': 'CANCELLED',
+}
+
+SERVICE_NAMES = dict(Appointment.SERVICE_CHOICES)
+
+
+def calendar_rows(date_from, date_to, statuses=None):
+    """Appointment dicts in the range, by date and time, streamed from the database"""
+    appointments = Appointment.objects.filter(appointment_date__range=(date_from, date_to))
+    if statuses:
+        appointments = appointments.filter(status__in=statuses)
+    return (
+        appointments.order_by('appointment_date', 'appointment_time', 'id')
+        .values(*CALENDAR_FIELDS)
+        .iterator(chunk_size=2000)
+    )
+
+
+def iter_calendar_json(rows, date_from, date_to, chunk_rows=200):
+    """Yield a JSON document {"from", "to", "appointments": [...]} in chunks"""
+    yield '{{"from": "{}", "to": "{}", "appointments": ['.format(date_from.isoformat(), date_to.isoformat())
+    chunk, first = [], True
+    for row in rows:
+        row['appointment_date'] = row['appointment_date'].isoformat()
+        row['appointment_time'] = row['appointment_time'].strftime('%H:%M')
+        chunk.append(('' if first else ',') + json.dumps(row))
+        first = False
+        if len(chunk) >= chunk_rows:
+            yield ''.join(chunk)
+            chunk = []
+    chunk.append(']}')
+    yield ''.join(chunk)
+
+
+def ics_escape(value):
+    return (value or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n')
+
+
+def ics_line(line):
+    """Fold a content line at 75 octets, as RFC 5545 requires, with CRLF endings"""
+    data = line.encode()
+    if len(data) <= 75:
+        return line + '\r\n'
+    parts, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        # Do not split a multi-byte UTF-8 character
+        while end < len(data) and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode())
+        start, limit = end, 74
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def ics_time(value):
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def iter_ics(rows, host, chunk_rows=200):
+    """Yield an iCalendar file with one VEVENT per appointment, in chunks"""
+    stamp = ics_time(timezone.now())
+    clinic_tz = timezone.get_current_timezone()
+    yield ''.join(ics_line(line) for line in (
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:-//{host}//Appointments//EN',
+        'CALSCALE:GREGORIAN',
+        'X-WR-CALNAME:Appointments',
+    ))
+    chunk = []
+    for row in rows:
+        start = datetime.combine(row['appointment_date'], row['appointment_time'], tzinfo=clinic_tz)
+        name = f"{row['first_name']} {row['last_name']}"
+        description = f"{name}\nPhone: {row['phone']}\nEmail: {row['email']}"
+        if row['message']:
+            description += f"\n\n{row['message']}"
+        chunk.append(''.join(ics_line(line) for line in (
+            'BEGIN:VEVENT',
+            f"UID:appointment-{row['id']}@{host}",
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{ics_time(start)}',
+            f'DTEND:{ics_time(start + APPOINTMENT_DURATION)}',
+            f"SUMMARY:{ics_escape(SERVICE_NAMES.get(row['service'], row['service']))} - {ics_escape(name)}",
+            f'DESCRIPTION:{ics_escape(description)}',
+            f"STATUS:{ICS_STATUS.get(row['status'], 'TENTATIVE')}",
+            'END:VEVENT',
+        )))
+        if len(chunk) >= chunk_rows:
+            yield ''.join(chunk)
+            chunk = []
+    chunk.append(ics_line('END:VCALENDAR'))
+    yield ''.join(chunk)
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from frontendCore.reminders import REMINDER_BATCH_SIZE, REMINDER_LEAD, queue_reminders
+
+
+class Command(BaseCommand):
+    """
+    Queue reminder emails for confirmed appointments starting within
+    --hours (see frontendCore.reminders). The outbox worker,
+    send_outbound_emails, sends them.
+
+    Run it from cron, e.g. every 15 minutes. Appointments that already
+    have a reminder are skipped, so overlapping runs are harmless.
+    """
+    help = 'Queue reminder emails for upcoming confirmed appointments'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours', type=float, default=REMINDER_LEAD.total_seconds() / 3600,
+            help='Remind appointments starting within this many hours'
+        )
+        parser.add_argument('--batch-size', type=int, default=REMINDER_BATCH_SIZE, help='Appointments per transaction')
+
+    def handle(self, *args, **options):
+        queued = queue_reminders(lead=timedelta(hours=options['hours']), batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Queued {queued} appointment reminder(s)'))
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from frontendCore.outbox import OUTBOX_BATCH_SIZE, drain_outbox
+
+
+class Command(BaseCommand):
+    """
+    Send queued emails from the outbox (see frontendCore.outbox).
+
+    Run it from cron every minute, or once with --loop to keep draining
+    every --interval seconds in the foreground.
+    """
+    help = 'Send pending outbound emails'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=OUTBOX_BATCH_SIZE, help='Emails sent per connection')
+        parser.add_argument('--loop', action='store_true', help='Keep running, checking every --interval seconds')
+        parser.add_argument('--interval', type=int, default=10, help='Seconds between checks with --loop')
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            sent, failed = drain_outbox(batch_size=options['batch_size'])
+            if sent or failed or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f'Sent {sent} email(s); {failed} failed and will be retried or given up'))
+            if not options['loop']:
+                return
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                return
@@ -0,0 +1,123 @@
+"""
+Full-page cache for anonymous visitors to the frontend pages.
+
+CACHED_PAGES maps page paths to the data they are built from. A GET from
+a visitor without a session is answered straight from the cache when
+the page's key matches. The key is made of the path, the query
+parameters normalised as the view reads them, the origin, and the
+current version of each data dependency (see Backend.caching). A query
+that does not normalise (unknown parameters, a page that does not
+exist) is not served from or stored in the cache, so the number of
+copies of a page is bounded by its real variants. The middleware sits first in
+MIDDLEWARE, so a hit skips URL resolution, the view and template
+rendering. A model change bumps its version, so only the pages built
+from it re-render.
+
+Only complete, plain 200 responses are stored: no Set-Cookie (e.g. a
+CSRF token was issued), no Cache-Control: private/no-store, no
+streaming. Every response this middleware handles carries Vary: Cookie,
+so shared caches downstream do not hand an anonymous page to a signed-in
+visitor.
+"""
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import urlencode
+
+from Backend.caching import get_version
+
+from .shop import shop_cache_params
+
+
+def no_params(query):
+    """Pages that take no query parameters: any parameter bypasses the cache"""
+    return None if query else []
+
+
+def shop_fragment_params(query):
+    return shop_cache_params(query, strict=True)
+
+
+# (path pattern, data versions the page depends on,
+#  function from request.GET to the normalised [(name, value)] that select content, or None)
+CACHED_PAGES = [
+    (re.compile(r'^/$'), ('services', 'testimonials'), no_params),
+    (re.compile(r'^/home2/$'), (), no_params),
+    (re.compile(r'^/about/$'), (), no_params),
+    (re.compile(r'^/shop/$'), ('products',), shop_cache_params),
+    (re.compile(r'^/shop/products/$'), ('products',), shop_fragment_params),
+    (re.compile(r'^/services/$'), ('services',), no_params),
+    (re.compile(r'^/contact/$'), (), no_params),
+    (re.compile(r'^/news/$'), (), no_params),
+    (re.compile(r'^/news/\d+/$'), (), no_params),
+    (re.compile(r'^/product/\d+/$'), (), no_params),
+    (re.compile(r'^/cart/$'), (), no_params),
+    (re.compile(r'^/checkout/$'), (), no_params),
+    (re.compile(r'^/404/$'), (), no_params),
+]
+
+# Any of these cookies means the page may be personalised
+PERSONAL_COOKIES = (settings.SESSION_COOKIE_NAME, 'messages')
+
+
+def page_rule(path):
+    for pattern, versions, normalize in CACHED_PAGES:
+        if pattern.match(path):
+            return versions, normalize
+    return None
+
+
+class AnonymousPageCacheMiddleware:
+    """Serve and store whole frontend pages for anonymous GET requests"""
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.timeout = settings.FRONTEND_PAGE_CACHE_TIMEOUT
+    
+    def __call__(self, request):
+        key = self.cache_key(request) if self.timeout else None
+        if key is None:
+            return self.get_response(request)
+        
+        cached = cache.get(key)
+        if cached is not None:
+            content, headers = cached
+            response = HttpResponse(content)
+            for header, value in headers:
+                response[header] = value
+            return response
+        
+        response = self.get_response(request)
+        patch_vary_headers(response, ('Cookie',))
+        if request.method == 'GET' and self.cacheable(response):
+            headers = [(header, value) for header, value in response.items() if header.lower() != 'set-cookie']
+            cache.set(key, (response.content, headers), self.timeout)
+        return response
+    
+    def cache_key(self, request):
+        """The cache key for the request, or None if it must not be served from the cache"""
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        if 'HTTP_AUTHORIZATION' in request.META or any(name in request.COOKIES for name in PERSONAL_COOKIES):
+            return None
+        rule = page_rule(request.path_info)
+        if rule is None:
+            return None
+        versions, normalize = rule
+        # Keyed on normalised values only, so arbitrary parameters or values
+        # cannot fill the cache with copies of a page
+        params = normalize(request.GET)
+        if params is None:
+            return None
+        query = urlencode(params)
+        stamp = ':'.join(str(get_version(name)) for name in versions)
+        return f'page:{request.scheme}://{request.get_host()}{request.path_info}?{query}:{stamp}'
+    
+    def cacheable(self, response):
+        if response.status_code != 200 or response.streaming or response.cookies:
+            return False
+        cache_control = response.get('Cache-Control', '')
+        return 'private' not in cache_control and 'no-store' not in cache_control
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontendCore', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AppointmentSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('time', models.TimeField()),
+            ],
+            options={
+                'verbose_name': 'Appointment Slot',
+                'verbose_name_plural': 'Appointment Slots',
+            },
+        ),
+        migrations.CreateModel(
+            name='SlotCapacity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('service', models.CharField(blank=True, choices=[('general_checkup', 'General Checkup'), ('cleaning', 'Teeth Cleaning'), ('filling', 'Dental Filling'), ('extraction', 'Tooth Extraction'), ('crown', 'Dental Crown'), ('root_canal', 'Root Canal Treatment'), ('orthodontics', 'Orthodontics Consultation'), ('cosmetic', 'Cosmetic Dentistry'), ('emergency', 'Emergency Treatment'), ('other', 'Other')], help_text='Leave blank to apply to every service', max_length=50)),
+                ('weekday', models.PositiveSmallIntegerField(blank=True, choices=[(0, 'Monday'), (1, 'Tuesday'), (2, 'Wednesday'), (3, 'Thursday'), (4, 'Friday'), (5, 'Saturday'), (6, 'Sunday')], help_text='Leave blank to apply to every day', null=True)),
+                ('capacity', models.PositiveSmallIntegerField(help_text='Appointments per time slot; 0 closes the slot')),
+            ],
+            options={
+                'verbose_name': 'Slot Capacity',
+                'verbose_name_plural': 'Slot Capacities',
+                'ordering': ['service', 'weekday'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['appointment_date', 'appointment_time', 'status'], name='appointment_slot_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='appointmentslot',
+            constraint=models.UniqueConstraint(fields=('date', 'time'), name='unique_appointment_slot'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontendCore', '0004_appointment_reminders'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='appointment',
+            name='appointment_slot_idx',
+        ),
+        migrations.AlterField(
+            model_name='slotcapacity',
+            name='capacity',
+            field=models.PositiveSmallIntegerField(help_text='Appointments of a service per time slot; 0 closes the slot'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['appointment_date', 'appointment_time', 'service', 'status'], name='appointment_slot_idx'),
+        ),
+    ]
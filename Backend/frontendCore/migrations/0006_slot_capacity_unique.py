@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-19 05:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('frontendCore', '0005_appointment_service_slot_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='slotcapacity',
+            constraint=models.UniqueConstraint(condition=models.Q(('weekday__isnull', False)), fields=('service', 'weekday'), name='unique_slot_capacity', violation_error_message='There is already a rule for this service and weekday.'),
+        ),
+        migrations.AddConstraint(
+            model_name='slotcapacity',
+            constraint=models.UniqueConstraint(condition=models.Q(('weekday__isnull', True)), fields=('service',), name='unique_slot_capacity_any_day', violation_error_message='There is already a rule for this service and weekday.'),
+        ),
+    ]
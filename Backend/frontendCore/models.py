@@ -42,11 +42,25 @@ class Appointment(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    reminder_sent_at = models.DateTimeField(null=True, blank=True, editable=False)
+    
+    # Statuses that hold a slot
+    ACTIVE_STATUSES = ('pending', 'confirmed', 'completed')
     
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Appointment'
         verbose_name_plural = 'Appointments'
+        indexes = [
+            # Availability: bookings per service and slot over a date range (see frontendCore.availability)
+            models.Index(fields=['appointment_date', 'appointment_time', 'service', 'status'], name='appointment_slot_idx'),
+            # Reminders not sent yet, by date (see frontendCore.reminders)
+            models.Index(
+                fields=['status', 'appointment_date'],
+                condition=models.Q(reminder_sent_at__isnull=True),
+                name='appointment_reminder_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.appointment_date} {self.appointment_time}"
@@ -61,3 +75,114 @@ class Appointment(models.Model):
         if len(self.phone) == 10:
             return f"({self.phone[:3]}) {self.phone[3:6]}-{self.phone[6:]}"
         return self.phone
+
+
+class SlotCapacity(models.Model):
+    """
+    How many appointments of one service can share a time slot. A rule can
+    be limited to a service and/or a weekday; the most specific matching
+    rule wins, and settings.APPOINTMENT_SLOT_CAPACITY applies when none
+    match. Each service's places are separate from the other services'.
+    """
+    WEEKDAY_CHOICES = [
+        (0, 'Monday'),
+        (1, 'Tuesday'),
+        (2, 'Wednesday'),
+        (3, 'Thursday'),
+        (4, 'Friday'),
+        (5, 'Saturday'),
+        (6, 'Sunday'),
+    ]
+    
+    service = models.CharField(
+        max_length=50, choices=Appointment.SERVICE_CHOICES, blank=True,
+        help_text="Leave blank to apply to every service"
+    )
+    weekday = models.PositiveSmallIntegerField(
+        choices=WEEKDAY_CHOICES, null=True, blank=True,
+        help_text="Leave blank to apply to every day"
+    )
+    capacity = models.PositiveSmallIntegerField(help_text="Appointments of a service per time slot; 0 closes the slot")
+    
+    class Meta:
+        ordering = ['service', 'weekday']
+        verbose_name = 'Slot Capacity'
+        verbose_name_plural = 'Slot Capacities'
+        constraints = [
+            # One rule per service and weekday. NULL weekdays never clash in
+            # a unique index, so "any day" rules get their own constraint.
+            models.UniqueConstraint(
+                fields=['service', 'weekday'], condition=models.Q(weekday__isnull=False),
+                name='unique_slot_capacity',
+                violation_error_message='There is already a rule for this service and weekday.',
+            ),
+            models.UniqueConstraint(
+                fields=['service'], condition=models.Q(weekday__isnull=True),
+                name='unique_slot_capacity_any_day',
+                violation_error_message='There is already a rule for this service and weekday.',
+            ),
+        ]
+    
+    def __str__(self):
+        service = self.get_service_display() if self.service else 'Any service'
+        weekday = self.get_weekday_display() if self.weekday is not None else 'any day'
+        return f"{service}, {weekday}: {self.capacity} per slot"
+
+
+class AppointmentSlot(models.Model):
+    """
+    A date and time that has been booked at least once. Booking writes and
+    locks this row, so concurrent bookings of the same slot check capacity
+    one at a time.
+    """
+    date = models.DateField()
+    time = models.TimeField()
+    
+    class Meta:
+        verbose_name = 'Appointment Slot'
+        verbose_name_plural = 'Appointment Slots'
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'time'], name='unique_appointment_slot'),
+        ]
+    
+    def __str__(self):
+        return f"{self.date} {self.time}"
+
+
+class OutboundEmail(models.Model):
+    """
+    An email waiting in the outbox. Rows are written in the same transaction
+    as the change that triggers them and sent by the send_outbound_emails
+    worker (see frontendCore.outbox).
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255, blank=True, help_text="Leave blank for DEFAULT_FROM_EMAIL")
+    
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, help_text="Not sent before this time")
+    claimed_by = models.CharField(max_length=32, blank=True, help_text="Worker batch currently sending this email")
+    last_error = models.TextField(blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Outbound Email'
+        verbose_name_plural = 'Outbound Emails'
+        indexes = [
+            # Worker: due emails, oldest first
+            models.Index(fields=['next_attempt_at'], condition=models.Q(status='pending'), name='outbound_email_due_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.subject} -> {self.recipient} ({self.status})"
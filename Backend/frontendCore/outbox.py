@@ -0,0 +1,113 @@
+"""
+Durable outbox for outbound email.
+
+Requests never talk to the mail server: enqueue_email() writes an
+OutboundEmail row, normally inside the transaction that made the change
+(so the email exists if and only if the booking does), and the
+send_outbound_emails worker drains the outbox.
+
+Each batch is claimed by a token so that several workers can run without
+sending an email twice. A batch is sent over one connection from
+get_connection(). Failures are retried with exponential backoff, and
+after MAX_ATTEMPTS the row is marked failed, with the last error kept.
+Any EMAIL_BACKEND works, including locmem in tests.
+"""
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 50
+MAX_ATTEMPTS = 6
+RETRY_BASE_DELAY = timedelta(minutes=1)
+RETRY_MAX_DELAY = timedelta(hours=6)
+# A claimed batch that is not finished by then (worker died) becomes due again
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def enqueue_email(recipient, subject, body, from_email=''):
+    """Queue an email for the outbox worker and return the OutboundEmail"""
+    return OutboundEmail.objects.create(recipient=recipient, subject=subject, body=body, from_email=from_email)
+
+
+def retry_delay(attempts):
+    """Backoff before the next try after `attempts` failed tries: 1, 2, 4 ... minutes, capped"""
+    return min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY)
+
+
+def claim_batch(now, batch_size=OUTBOX_BATCH_SIZE):
+    """Claim up to batch_size due emails for this worker; return them"""
+    token = uuid.uuid4().hex
+    due = OutboundEmail.objects.filter(status='pending', next_attempt_at__lte=now)
+    ids = list(due.order_by('next_attempt_at').values_list('id', flat=True)[:batch_size])
+    if not ids:
+        return []
+    # Only rows still due are claimed, so a concurrent worker's claim wins
+    due.filter(id__in=ids).update(claimed_by=token, next_attempt_at=now + CLAIM_TIMEOUT)
+    return list(OutboundEmail.objects.filter(claimed_by=token, status='pending'))
+
+
+def send_batch(emails, now=None):
+    """Send claimed emails over one connection; return (sent, failed) counts"""
+    now = now or timezone.now()
+    sent = failed = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        try:
+            connection.open()
+            connect_error = None
+        except Exception as e:
+            # Counts as a failed attempt for every email in the batch
+            connect_error = e
+        for email in emails:
+            message = EmailMessage(
+                email.subject, email.body, email.from_email or settings.DEFAULT_FROM_EMAIL,
+                [email.recipient], connection=connection,
+            )
+            email.attempts += 1
+            email.claimed_by = ''
+            try:
+                if connect_error is not None:
+                    raise connect_error
+                connection.send_messages([message])
+            except Exception as e:
+                failed += 1
+                email.last_error = f'{type(e).__name__}: {e}'
+                if email.attempts >= MAX_ATTEMPTS:
+                    email.status = 'failed'
+                    logger.error('Giving up on outbound email %s after %d attempts: %s', email.pk, email.attempts, e)
+                else:
+                    email.next_attempt_at = now + retry_delay(email.attempts)
+            else:
+                sent += 1
+                email.status = 'sent'
+                email.sent_at = now
+                email.last_error = ''
+            email.save(update_fields=['status', 'attempts', 'next_attempt_at', 'claimed_by', 'last_error', 'sent_at'])
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            logger.exception('Failed to close the email connection')
+    return sent, failed
+
+
+def drain_outbox(batch_size=OUTBOX_BATCH_SIZE):
+    """Send every email that is due, batch by batch; return (sent, failed) totals"""
+    now = timezone.now()
+    totals = [0, 0]
+    while True:
+        emails = claim_batch(now, batch_size)
+        if not emails:
+            break
+        sent, failed = send_batch(emails, now)
+        totals[0] += sent
+        totals[1] += failed
+    return tuple(totals)
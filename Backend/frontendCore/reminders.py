@@ -0,0 +1,82 @@
+"""
+Reminder emails for upcoming appointments.
+
+queue_reminders() finds confirmed appointments that start within the
+next REMINDER_LEAD and have no reminder yet. The search is a range over
+appointment_reminder_idx (status, appointment_date), a partial index
+that only holds appointments still waiting for a reminder, so it stays
+small however many appointments have been booked.
+
+Work is done REMINDER_BATCH_SIZE appointments at a time. Each batch is
+one transaction: the reminders go into the outbox with one bulk_create
+(frontendCore.outbox sends them), and the appointments are stamped with
+one bulk_update. A stamped appointment leaves the index, so each batch
+re-reads the head of the range, only one batch is held in memory, and a
+second run (or one that died halfway) never queues a reminder twice.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Appointment, OutboundEmail
+
+REMINDER_LEAD = timedelta(hours=24)
+REMINDER_BATCH_SIZE = 500
+
+
+def reminder_email(appointment):
+    """The OutboundEmail (unsaved) reminding the patient of an appointment"""
+    return OutboundEmail(
+        recipient=appointment.email,
+        subject='Appointment Reminder',
+        body=f'''
+Dear {appointment.first_name} {appointment.last_name},
+
+This is a reminder of your appointment with our dental clinic.
+
+Appointment Details:
+- Date: {appointment.appointment_date}
+- Time: {appointment.appointment_time:%H:%M}
+- Service: {appointment.get_service_display()}
+
+If you need to make any changes or have questions, please call us at +1 (555) 123-4567.
+
+Best regards,
+Dental Clinic Team
+        '''
+    )
+
+
+def due_reminders(now, lead=REMINDER_LEAD):
+    """Confirmed appointments from now until now + lead that have no reminder yet"""
+    start = timezone.localtime(now)
+    end = start + lead
+    return Appointment.objects.filter(
+        status='confirmed',
+        reminder_sent_at__isnull=True,
+        appointment_date__range=(start.date(), end.date()),
+    ).exclude(
+        appointment_date=start.date(), appointment_time__lt=start.time()
+    ).exclude(
+        appointment_date=end.date(), appointment_time__gt=end.time()
+    )
+
+
+def queue_reminders(now=None, lead=REMINDER_LEAD, batch_size=REMINDER_BATCH_SIZE):
+    """Queue reminders for every due appointment; return how many were queued"""
+    now = now or timezone.now()
+    queued = 0
+    due = due_reminders(now, lead).order_by('appointment_date').only(
+        'id', 'first_name', 'last_name', 'email', 'appointment_date', 'appointment_time', 'service'
+    )
+    while True:
+        with transaction.atomic():
+            batch = list(due.select_for_update(skip_locked=True)[:batch_size])
+            if not batch:
+                return queued
+            OutboundEmail.objects.bulk_create([reminder_email(appointment) for appointment in batch])
+            for appointment in batch:
+                appointment.reminder_sent_at = now
+            Appointment.objects.bulk_update(batch, ['reminder_sent_at'])
+        queued += len(batch)
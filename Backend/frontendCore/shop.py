@@ -0,0 +1,113 @@
+"""
+Server-side paging for the shop page.
+
+The shop lists active products SHOP_PAGE_SIZE at a time, filtered by
+category and sorted like the products API (?category=, ?ordering=).
+Each page is one values() query with the primary image path annotated
+(Product.serializers.primary_image_subquery), plus the paginator's
+count, so the cost of a page does not grow with the catalog. The first
+page is rendered into shop.html. Later pages are served by
+shop_products as the same card fragment, and the page appends them.
+
+shop_cache_params() reduces a request's query to the values the page is
+actually rendered from, so the page cache (frontendCore.middleware)
+keeps one copy per distinct page.
+"""
+from django.core.cache import cache
+from django.core.paginator import Paginator
+
+from Backend.caching import get_version
+from Product.models import Product, ProductImage
+from Product.serializers import primary_image_subquery
+from Product.signals import CATALOG_VERSION
+
+SHOP_PAGE_SIZE = 6
+SHOP_PAGE_COUNT_TIMEOUT = 24 * 60 * 60
+
+# Same choices as ProductListCreateView.ordering_fields
+SHOP_ORDERINGS = {
+    '-created_at': 'Newest',
+    'created_at': 'Oldest',
+    'price': 'Price: low to high',
+    '-price': 'Price: high to low',
+    'name': 'Name: A to Z',
+    '-name': 'Name: Z to A',
+}
+DEFAULT_ORDERING = '-created_at'
+
+CATEGORIES = dict(Product._meta.get_field('category').choices)
+
+
+def shop_params(query):
+    """The category and ordering a request asks for; unknown values fall back to all/newest"""
+    category = query.get('category', '')
+    if category not in CATEGORIES:
+        category = ''
+    ordering = query.get('ordering', DEFAULT_ORDERING)
+    if ordering not in SHOP_ORDERINGS:
+        ordering = DEFAULT_ORDERING
+    return category, ordering
+
+
+def shop_page_count(category=''):
+    """Number of shop pages for a category, cached per product catalog version"""
+    key = f'shop:pages:{get_version(CATALOG_VERSION)}:{category}'
+    pages = cache.get(key)
+    if pages is None:
+        pages = Paginator(shop_queryset(category), SHOP_PAGE_SIZE).num_pages
+        cache.set(key, pages, SHOP_PAGE_COUNT_TIMEOUT)
+    return pages
+
+
+def shop_cache_params(query, strict=False):
+    """
+    [(name, value)] that select the shop page (or, when strict, the
+    fragment) a query renders, after the same normalisation shop_page()
+    applies. None when the query has other parameters, or, when strict, a
+    page that does not exist (a 404, which is not cached).
+    """
+    if any(name not in ('category', 'ordering', 'page') for name in query):
+        return None
+    category, ordering = shop_params(query)
+    pages = shop_page_count(category)
+    try:
+        number = int(query.get('page', 1))
+    except (TypeError, ValueError):
+        if strict:
+            return None
+        number = 1
+    if not 1 <= number <= pages:
+        # Paginator.get_page() serves the last page for any out of range number
+        if strict:
+            return None
+        number = pages
+    return [('category', category), ('ordering', ordering), ('page', number)]
+
+
+def shop_queryset(category='', ordering=DEFAULT_ORDERING):
+    """Card rows for the active products in a category, in a stable order"""
+    queryset = Product.objects.filter(is_active=True)
+    if category:
+        queryset = queryset.filter(category=category)
+    return queryset.annotate(
+        image_name=primary_image_subquery()
+    ).order_by(ordering, '-id').values(
+        'id', 'name', 'price', 'category', 'image_name'
+    )
+
+
+def shop_page(query, strict=False):
+    """
+    Paginator page of card rows for the request's filters and ?page=.
+    Out of range pages are clamped, or raise InvalidPage when strict
+    (fragments, where a bad page is a client error).
+    """
+    category, ordering = shop_params(query)
+    paginator = Paginator(shop_queryset(category, ordering), SHOP_PAGE_SIZE)
+    page_number = query.get('page', 1)
+    page = paginator.page(page_number) if strict else paginator.get_page(page_number)
+    storage = ProductImage._meta.get_field('image').storage
+    page.object_list = list(page.object_list)
+    for row in page.object_list:
+        row['image_url'] = storage.url(row['image_name']) if row['image_name'] else None
+    return page, category, ordering
@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from Backend.caching import bump_version
+
+from .availability import CAPACITY_VERSION
+from .models import SlotCapacity
+
+
+@receiver(post_save, sender=SlotCapacity)
+@receiver(post_delete, sender=SlotCapacity)
+def slot_capacity_changed(sender, instance, **kwargs):
+    """Drop the cached capacity rules"""
+    transaction.on_commit(lambda: bump_version(CAPACITY_VERSION))
@@ -0,0 +1,189 @@
+"""
+Sitemaps and RSS/Atom feeds for the blog, product catalog and services.
+
+Every document is cached under a signature of its section: the row count
+and latest updated_at of the visible rows. Serving a cached document
+costs that one aggregate query. Sitemaps are streamed from values_list()
+iterators and split into pages of SITEMAP_PAGE_SIZE URLs, as the
+sitemap protocol allows at most 50,000 URLs per file. Pages are id
+ranges, not offsets: the id each page starts after is found for all
+pages at once and cached with the signature, so a page is one scan of
+its own rows.
+"""
+import math
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Max, Window
+from django.db.models.functions import RowNumber
+from django.urls import reverse
+from django.utils import feedgenerator
+
+SITEMAP_PAGE_SIZE = 50000
+FEED_ITEMS = 50
+SEO_CACHE_TIMEOUT = 24 * 60 * 60
+
+_ID_PLACEHOLDER = 987654321
+
+
+def _blog_posts():
+    from Blog.models import BlogPost
+    return BlogPost.objects.filter(status='published')
+
+
+def _products():
+    from Product.models import Product
+    return Product.objects.filter(is_active=True)
+
+
+def _services():
+    from Service.models import Service
+    return Service.objects.filter(is_active=True)
+
+
+# section -> (queryset factory, frontend url name, url kwarg, url field, title field, description field, feed title)
+SECTIONS = {
+    'blog': (_blog_posts, 'frontend:single_news', 'news_id', 'id', 'title', 'description', 'DentalCom News'),
+    'products': (_products, 'frontend:single_product', 'product_id', 'id', 'name', 'description', 'DentalCom Products'),
+    'services': (_services, 'frontend:single_service_slug', 'slug', 'slug', 'name', 'description', 'DentalCom Services'),
+}
+
+
+def absolute_url(path):
+    return settings.BASE_URL.rstrip('/') + path
+
+
+def url_builder(section):
+    """Reverse the detail URL once and return a fast url field -> absolute URL function"""
+    _, url_name, url_kwarg = SECTIONS[section][:3]
+    # The placeholder is all digits, so it reverses through int and slug converters alike
+    template = absolute_url(reverse(url_name, kwargs={url_kwarg: _ID_PLACEHOLDER}))
+    prefix, suffix = template.split(str(_ID_PLACEHOLDER))
+    return lambda value: f'{prefix}{value}{suffix}'
+
+
+def section_signature(section):
+    """(count, last_modified) of the visible rows in a section, in one aggregate query"""
+    stats = SECTIONS[section][0]().aggregate(count=Count('id'), last_modified=Max('updated_at'))
+    return stats['count'], stats['last_modified']
+
+
+def _signature_key(kind, section, signature, page=''):
+    count, last_modified = signature
+    stamp = last_modified.timestamp() if last_modified else 0
+    return f'seo:{kind}:{section}:{page}:{count}:{stamp}'
+
+
+def sitemap_page_count(signature):
+    return max(1, math.ceil(signature[0] / SITEMAP_PAGE_SIZE))
+
+
+def render_sitemap_index(signatures):
+    """Sitemap index listing every page of every section; signatures maps section -> signature"""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    for section, signature in signatures.items():
+        lastmod = signature[1]
+        for page in range(1, sitemap_page_count(signature) + 1):
+            loc = absolute_url(reverse('frontend:sitemap_section', kwargs={'section': section, 'page': page}))
+            parts.append(f'<sitemap><loc>{escape(loc)}</loc>')
+            if lastmod:
+                parts.append(f'<lastmod>{lastmod.isoformat()}</lastmod>')
+            parts.append('</sitemap>\n')
+    parts.append('</sitemapindex>\n')
+    return ''.join(parts).encode()
+
+
+def sitemap_page_starts(section, signature):
+    """[id each sitemap page starts after], page 1 first; cached with the section signature"""
+    key = _signature_key('sitemap-starts', section, signature)
+    starts = cache.get(key)
+    if starts is None:
+        # Last id of every full page, in one pass over the ids
+        ends = SECTIONS[section][0]().annotate(
+            position=Window(RowNumber(), order_by=F('id').asc())
+        ).annotate(
+            page_offset=F('position') % SITEMAP_PAGE_SIZE
+        ).filter(page_offset=0).order_by('id').values_list('id', flat=True)
+        starts = [0, *ends]
+        cache.set(key, starts, SEO_CACHE_TIMEOUT)
+    return starts
+
+
+def iter_sitemap_page(section, page, start_after=0):
+    """Yield one sitemap page (the rows with id > start_after) as XML chunks, streaming rows from the database"""
+    build_url = url_builder(section)
+    queryset_factory, _, _, url_field = SECTIONS[section][:4]
+    rows = queryset_factory().filter(id__gt=start_after).order_by('id').values_list(
+        url_field, 'updated_at'
+    )[:SITEMAP_PAGE_SIZE]
+
+    yield ('<?xml version="1.0" encoding="UTF-8"?>\n'
+           '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+    chunk = []
+    for value, updated_at in rows.iterator(chunk_size=2000):
+        chunk.append(f'<url><loc>{escape(build_url(value))}</loc><lastmod>{updated_at.isoformat()}</lastmod></url>\n')
+        if len(chunk) >= 500:
+            yield ''.join(chunk)
+            chunk = []
+    chunk.append('</urlset>\n')
+    yield ''.join(chunk)
+
+
+def cached_sitemap_page(section, page, signature):
+    """
+    Return (cached bytes, None) on a hit, or (None, chunk iterator) on a
+    miss. The iterator stores the full document in the cache once streamed.
+    """
+    key = _signature_key('sitemap', section, signature, page)
+    payload = cache.get(key)
+    if payload is not None:
+        return payload, None
+
+    start_after = sitemap_page_starts(section, signature)[page - 1]
+
+    def stream():
+        parts = []
+        for chunk in iter_sitemap_page(section, page, start_after):
+            data = chunk.encode()
+            parts.append(data)
+            yield data
+        cache.set(key, b''.join(parts), SEO_CACHE_TIMEOUT)
+
+    return None, stream()
+
+
+def render_feed(section, feed_format, signature):
+    """Latest FEED_ITEMS rows of a section as RSS 2.0 or Atom 1.0 bytes, cached"""
+    key = _signature_key(f'feed-{feed_format}', section, signature)
+    payload = cache.get(key)
+    if payload is not None:
+        return payload
+
+    queryset_factory, _, _, url_field, title_field, description_field, feed_title = SECTIONS[section]
+    feed_class = feedgenerator.Atom1Feed if feed_format == 'atom' else feedgenerator.Rss201rev2Feed
+    feed = feed_class(
+        title=feed_title,
+        link=absolute_url('/'),
+        description=feed_title,
+        language=settings.LANGUAGE_CODE,
+        feed_url=absolute_url(reverse('frontend:feed', kwargs={'section': section, 'feed_format': feed_format})),
+    )
+    build_url = url_builder(section)
+    rows = queryset_factory().order_by('-updated_at').values_list(
+        url_field, title_field, description_field, 'created_at', 'updated_at'
+    )[:FEED_ITEMS]
+    for value, title, description, created_at, updated_at in rows:
+        link = build_url(value)
+        feed.add_item(
+            title=title,
+            link=link,
+            description=description[:500],
+            unique_id=link,
+            pubdate=created_at,
+            updateddate=updated_at,
+        )
+    payload = feed.writeString('utf-8').encode()
+    cache.set(key, payload, SEO_CACHE_TIMEOUT)
+    return payload
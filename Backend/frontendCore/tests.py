@@ -1,3 +1,78 @@
-from django.test import TestCase
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
-# Create your tests here.
+from .models import OutboundEmail
+from .outbox import MAX_ATTEMPTS, drain_outbox, enqueue_email
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    """Email backend whose every send fails, as with an unreachable mail server"""
+
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError('mail server unavailable')
+
+
+FAILING_BACKEND = f'{__name__}.FailingEmailBackend'
+
+
+class OutboxTests(TestCase):
+    """Emails queued with enqueue_email() are delivered by drain_outbox()"""
+
+    def enqueue(self):
+        return enqueue_email('patient@example.com', 'Appointment Confirmation', 'See you soon')
+
+    def test_queued_email_is_only_sent_by_the_worker(self):
+        email = self.enqueue()
+        self.assertEqual(email.status, 'pending')
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(drain_outbox(), (1, 0))
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['patient@example.com'])
+        self.assertEqual(mail.outbox[0].subject, 'Appointment Confirmation')
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'sent')
+        self.assertEqual(email.attempts, 1)
+        self.assertIsNotNone(email.sent_at)
+        self.assertEqual(email.claimed_by, '')
+
+        # A sent email is never sent again
+        self.assertEqual(drain_outbox(), (0, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_failed_send_is_retried_later(self):
+        email = self.enqueue()
+
+        with override_settings(EMAIL_BACKEND=FAILING_BACKEND):
+            self.assertEqual(drain_outbox(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'pending')
+        self.assertEqual(email.attempts, 1)
+        self.assertIn('mail server unavailable', email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+
+        # Not due again until the backoff has passed
+        self.assertEqual(drain_outbox(), (0, 0))
+        self.assertEqual(len(mail.outbox), 0)
+
+        OutboundEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(drain_outbox(), (1, 0))
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'sent')
+        self.assertEqual(email.attempts, 2)
+        self.assertEqual(email.last_error, '')
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(EMAIL_BACKEND=FAILING_BACKEND)
+    def test_gives_up_after_max_attempts(self):
+        email = self.enqueue()
+        OutboundEmail.objects.filter(pk=email.pk).update(attempts=MAX_ATTEMPTS - 1)
+
+        with self.assertLogs('frontendCore.outbox', 'ERROR'):
+            self.assertEqual(drain_outbox(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'failed')
+        self.assertEqual(email.attempts, MAX_ATTEMPTS)
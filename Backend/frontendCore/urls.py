@@ -11,6 +11,7 @@ urlpatterns = [
     # Main pages
     path('about/', views.AboutView.as_view(), name='about'),
     path('shop/', views.ShopView.as_view(), name='shop'),
+    path('shop/products/', views.shop_products, name='shop_products'),
     path('contact/', views.ContactView.as_view(), name='contact'),
     path('news/', views.NewsView.as_view(), name='news'),
     
@@ -34,7 +35,13 @@ urlpatterns = [
     path('appointment/', views.AppointmentView.as_view(), name='appointment'),
     path('book-appointment/', views.book_appointment, name='book_appointment'),
     
+    # SEO: sitemaps and feeds
+    path('sitemap.xml', views.sitemap_index, name='sitemap'),
+    path('sitemap-<str:section>-<int:page>.xml', views.sitemap_section, name='sitemap_section'),
+    path('feeds/<str:section>/<str:feed_format>/', views.feed, name='feed'),
+    
     # Service pages
     path('services/', views.ServiceView.as_view(), name='services'),
     path('service/<int:service_id>/', views.SingleServiceView.as_view(), name='single_service'),
+    path('service/<str:slug>/', views.SingleServiceView.as_view(), name='single_service_slug'),
 ]
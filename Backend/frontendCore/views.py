@@ -1,13 +1,38 @@
-from django.shortcuts import render, redirect
+from django.core.cache import cache
+from django.shortcuts import render, redirect, get_object_or_404
 from django.views.generic import TemplateView
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse, JsonResponse, Http404, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.contrib import messages
 from django.utils import timezone
-from django.core.mail import send_mail
+from django.utils.dateparse import parse_date, parse_time
+from django.db import transaction
+from django.core.paginator import InvalidPage
 from django.conf import settings
+from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.response import Response
 from .models import Appointment
-from Product.models import Product
+from .outbox import enqueue_email
+from .calendar import MAX_CALENDAR_DAYS, calendar_rows, iter_calendar_json, iter_ics
+from .availability import (
+    SLOT_TIMES, MAX_AVAILABILITY_DAYS, SlotUnavailable, availability, reserve_appointment
+)
+from .shop import CATEGORIES, SHOP_ORDERINGS, shop_page
+from .sitemaps import (
+    SECTIONS, section_signature, sitemap_page_count, render_sitemap_index,
+    cached_sitemap_page, render_feed
+)
+from Backend.caching import get_version
+import hashlib
 import json
+from datetime import timedelta
+
+SERVICE_PAGE_CACHE_TIMEOUT = 24 * 60 * 60
 
 # Create your views here.
 
@@ -18,43 +43,13 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Get active services for the home page
-        from Service.models import Service
-        from Review.models import Review
+        from Service.cards import service_cards
+        from Review.testimonials import render_testimonials
         
-        services = Service.objects.filter(is_active=True).prefetch_related('images').order_by('-created_at')[:3]
-        # Convert to list of dictionaries to match API format
-        context['services'] = [
-            {
-                'id': service.id,
-                'name': service.name,
-                'slug': service.slug,
-                'description': service.description,
-                'meta_description': service.meta_description,
-                'image': {
-                    'image': service.images.first().image.url if service.images.exists() else None,
-                    'alt_text': service.images.first().alt_text if service.images.exists() else service.name
-                },
-                'images': [
-                    {
-                        'id': img.id,
-                        'image': img.image.url,
-                        'alt_text': img.alt_text or service.name,
-                        'order': img.order
-                    }
-                    for img in service.images.all().order_by('order')
-                ],
-                'category': 'dental_services',
-                'is_active': service.is_active,
-                'is_featured': service.is_featured,
-                'is_new': service.is_new,
-                'created_at': service.created_at.isoformat()
-            }
-            for service in services
-        ]
+        context['services'] = service_cards(limit=3)
         
-        # Get reviews for testimonials (only active/non-archived reviews)
-        reviews = Review.objects.select_related('user').filter(is_archived=False).order_by('-created_at')
-        context['reviews'] = reviews
+        # Testimonials are a bounded, cached fragment (see Review.testimonials)
+        context['testimonials_html'] = render_testimonials()
         
         return context
 
@@ -72,14 +67,34 @@ class ShopView(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Get all active products for the shop page
-        from Product.serializers import ProductListSerializer
-        products = Product.objects.filter(is_active=True).prefetch_related('images').order_by('-created_at')
-        # Serialize the products to match API format
-        serializer = ProductListSerializer(products, many=True)
-        context['products'] = serializer.data
+        # First page only; the rest is fetched from shop_products as needed
+        page, category, ordering = shop_page(self.request.GET)
+        context.update({
+            'page': page,
+            'page_range': page.paginator.get_elided_page_range(page.number),
+            'category': category,
+            'ordering': ordering,
+            'categories': CATEGORIES,
+            'orderings': SHOP_ORDERINGS,
+        })
         return context
 
+
+def shop_products(request):
+    """
+    One page of shop product cards as an HTML fragment
+    GET /shop/products/?page=2&category=cosmetic&ordering=price
+    The next page number, if any, is sent in X-Next-Page.
+    """
+    try:
+        page, category, ordering = shop_page(request.GET, strict=True)
+    except InvalidPage:
+        raise Http404('No such page')
+    response = render(request, 'Includes/product_cards.html', {'page': page})
+    if page.has_next():
+        response['X-Next-Page'] = page.next_page_number()
+    return response
+
 class SingleProductView(TemplateView):
     """Single product page view"""
     template_name = 'single-product.html'
@@ -129,50 +144,98 @@ class ServiceView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Get all active services for the services page
-        from Service.models import Service
-        services = Service.objects.filter(is_active=True).prefetch_related('images').order_by('-created_at')
-        # Convert to list of dictionaries to match API format
-        context['services'] = [
-            {
-                'id': service.id,
-                'name': service.name,
-                'slug': service.slug,
-                'description': service.description,
-                'meta_description': service.meta_description,
-                'image': {
-                    'image': service.images.first().image.url if service.images.exists() else None,
-                    'alt_text': service.images.first().alt_text if service.images.exists() else service.name
-                },
-                'images': [
-                    {
-                        'id': img.id,
-                        'image': img.image.url,
-                        'alt_text': img.alt_text or service.name,
-                        'order': img.order
-                    }
-                    for img in service.images.all().order_by('order')
-                ],
-                'category': 'dental_services',
-                'is_active': service.is_active,
-                'is_featured': service.is_featured,
-                'is_new': service.is_new,
-                'created_at': service.created_at.isoformat()
-            }
-            for service in services
-        ]
+        from Service.cards import service_cards
+        context['services'] = service_cards()
         return context
 
 class SingleServiceView(TemplateView):
-    """Single service page view"""
+    """
+    Single service page view, addressed by slug
+    The old id URLs redirect permanently to the slug URL. The rendered page
+    is cached per catalog version (see Service.signals) along with its ETag
+    and Last-Modified, so a conditional GET from a crawler or CDN is
+    answered with a 304 without rendering.
+    """
     template_name = 'service-details.html'
     
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        # Get the service by ID with prefetched images
+    def get(self, request, *args, **kwargs):
         from Service.models import Service
-        service = Service.objects.prefetch_related('images').get(id=kwargs['service_id'])
-        context['service'] = service
-        return context
+        
+        if 'service_id' in kwargs:
+            slug = Service.objects.filter(id=kwargs['service_id'], is_active=True).values_list('slug', flat=True).first()
+            if slug is None:
+                raise Http404('Service not found')
+            return redirect('frontend:single_service_slug', slug=slug, permanent=True)
+        
+        content, etag, last_modified = self.cached_page(kwargs['slug'])
+        response = HttpResponse(content)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return get_conditional_response(request, etag=etag, last_modified=last_modified, response=response)
+    
+    def cached_page(self, slug):
+        """(html bytes, ETag, Last-Modified timestamp) for the service page, rendered on a miss"""
+        from Service.cards import ordered_images_prefetch
+        from Service.models import Service
+        from Service.signals import CATALOG_VERSION
+        
+        key = f'services:page:{get_version(CATALOG_VERSION)}:{slug}'
+        page = cache.get(key)
+        if page is None:
+            service = get_object_or_404(
+                Service.objects.filter(is_active=True).prefetch_related(ordered_images_prefetch()),
+                slug=slug
+            )
+            content = self.render_to_response(self.get_context_data(service=service)).render().content
+            last_modified = max([service.updated_at] + [image.created_at for image in service.images.all()])
+            page = (content, quote_etag(hashlib.md5(content).hexdigest()), int(last_modified.timestamp()))
+            cache.set(key, page, SERVICE_PAGE_CACHE_TIMEOUT)
+        return page
+
+
+def _seo_response(request, response, last_modified):
+    """Add Last-Modified and answer If-Modified-Since with 304 when possible"""
+    if last_modified:
+        timestamp = int(last_modified.timestamp())
+        conditional = get_conditional_response(request, last_modified=timestamp, response=response)
+        if conditional is not response:
+            return conditional
+        response['Last-Modified'] = http_date(timestamp)
+    return response
+
+
+def sitemap_index(request):
+    """Sitemap index covering every page of the blog, product and service sitemaps"""
+    signatures = {section: section_signature(section) for section in SECTIONS}
+    last_modified = max((sig[1] for sig in signatures.values() if sig[1]), default=None)
+    response = HttpResponse(render_sitemap_index(signatures), content_type='application/xml')
+    return _seo_response(request, response, last_modified)
+
+
+def sitemap_section(request, section, page):
+    """One page (up to 50,000 URLs) of a section sitemap, streamed on a cache miss"""
+    if section not in SECTIONS:
+        raise Http404('Unknown sitemap section')
+    signature = section_signature(section)
+    if page < 1 or page > sitemap_page_count(signature):
+        raise Http404('Sitemap page out of range')
+    
+    payload, stream = cached_sitemap_page(section, page, signature)
+    if payload is not None:
+        response = HttpResponse(payload, content_type='application/xml')
+    else:
+        response = StreamingHttpResponse(stream, content_type='application/xml')
+    return _seo_response(request, response, signature[1])
+
+
+def feed(request, section, feed_format):
+    """RSS 2.0 or Atom 1.0 feed of the latest items in a section"""
+    if section not in SECTIONS or feed_format not in ('rss', 'atom'):
+        raise Http404('Unknown feed')
+    signature = section_signature(section)
+    content_type = 'application/atom+xml' if feed_format == 'atom' else 'application/rss+xml'
+    response = HttpResponse(render_feed(section, feed_format, signature), content_type=f'{content_type}; charset=utf-8')
+    return _seo_response(request, response, signature[1])
 
 
 def book_appointment(request):
@@ -199,24 +262,36 @@ def book_appointment(request):
             # Clean phone number (remove formatting)
             phone_clean = ''.join(filter(str.isdigit, phone))
             
-            # Create appointment
-            appointment = Appointment.objects.create(
-                first_name=first_name,
-                last_name=last_name,
-                email=email,
-                phone=phone_clean,
-                appointment_date=appointment_date,
-                appointment_time=appointment_time,
-                service=service,
-                message=message
-            )
+            try:
+                slot_date = parse_date(appointment_date)
+                slot_time = parse_time(appointment_time)
+            except ValueError:
+                slot_date = slot_time = None
+            if slot_date is None or slot_time is None or service not in dict(Appointment.SERVICE_CHOICES):
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Please choose a valid date, time and service.'
+                })
             
-            # Send confirmation email (if email is configured)
+            # Create appointment, reserving a place in the slot atomically;
+            # the confirmation email is queued in the same transaction
             try:
-                if hasattr(settings, 'EMAIL_HOST') and settings.EMAIL_HOST:
-                    send_mail(
-                        'Appointment Booking Confirmation',
-                        f'''
+                with transaction.atomic():
+                    appointment = reserve_appointment(
+                        first_name=first_name,
+                        last_name=last_name,
+                        email=email,
+                        phone=phone_clean,
+                        appointment_date=slot_date,
+                        appointment_time=slot_time,
+                        service=service,
+                        message=message
+                    )
+                    if hasattr(settings, 'EMAIL_HOST') and settings.EMAIL_HOST:
+                        enqueue_email(
+                            email,
+                            'Appointment Booking Confirmation',
+                            f'''
 Dear {first_name} {last_name},
 
 Thank you for booking an appointment with our dental clinic.
@@ -233,14 +308,13 @@ If you need to make any changes or have questions, please call us at +1 (555) 12
 
 Best regards,
 Dental Clinic Team
-                        ''',
-                        settings.DEFAULT_FROM_EMAIL,
-                        [email],
-                        fail_silently=True,
-                    )
-            except Exception as e:
-                # Log error but don't fail the appointment creation
-                print(f"Email sending failed: {e}")
+                        '''
+                        )
+            except SlotUnavailable as e:
+                return JsonResponse({
+                    'success': False,
+                    'message': str(e)
+                })
             
             return JsonResponse({
                 'success': True,
@@ -257,4 +331,87 @@ Dental Clinic Team
     return JsonResponse({
         'success': False,
         'message': 'Invalid request method.'
-    })
\ No newline at end of file
+    })
+
+
+def date_range_params(request, max_days, default_days=30):
+    """
+    (from, to, None) from the `from`/`to` query params, or (None, None, error
+    response). `from` defaults to today and `to` to default_days later.
+    """
+    try:
+        date_from = parse_date(request.query_params.get('from', '')) or timezone.localdate()
+        date_to = parse_date(request.query_params.get('to', '')) or date_from + timedelta(days=default_days)
+    except ValueError:
+        return None, None, Response({'error': 'Dates must be valid YYYY-MM-DD dates'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    if date_to < date_from:
+        return None, None, Response({'error': '`to` must not be before `from`'}, status=status.HTTP_400_BAD_REQUEST)
+    if (date_to - date_from).days >= max_days:
+        return None, None, Response(
+            {'error': f'At most {max_days} days can be requested at once'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return date_from, date_to, None
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def appointment_availability(request):
+    """
+    Remaining places for a service per time slot for each day in a date range
+    GET /api/appointments/availability/?from=2026-11-01&to=2026-11-30&service=cleaning
+    `service` is required; `from` defaults to today and `to` to 30 days later;
+    at most MAX_AVAILABILITY_DAYS days.
+    """
+    date_from, date_to, error = date_range_params(request, MAX_AVAILABILITY_DAYS)
+    if error:
+        return error
+    
+    service = request.query_params.get('service', '')
+    if service not in dict(Appointment.SERVICE_CHOICES):
+        return Response({'error': 'Unknown or missing service'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    days = availability(date_from, date_to, service)
+    return Response({
+        'slot_times': [slot.strftime('%H:%M') for slot in SLOT_TIMES],
+        'days': {day.isoformat(): remaining for day, remaining in days.items()}
+    })
+
+
+def calendar_statuses(request):
+    """Statuses from ?status=pending,confirmed, ignoring unknown values"""
+    known = dict(Appointment.STATUS_CHOICES)
+    return [value for value in request.query_params.get('status', '').split(',') if value in known]
+
+
+@api_view(['GET'])
+@authentication_classes([JWTAuthentication, SessionAuthentication])
+@permission_classes([IsAdminUser])
+def appointment_calendar(request):
+    """
+    Staff: appointments in a date range as JSON, streamed
+    GET /api/appointments/calendar/?from=2026-01-01&to=2026-12-31&status=pending,confirmed
+    """
+    date_from, date_to, error = date_range_params(request, MAX_CALENDAR_DAYS)
+    if error:
+        return error
+    rows = calendar_rows(date_from, date_to, calendar_statuses(request))
+    return StreamingHttpResponse(iter_calendar_json(rows, date_from, date_to), content_type='application/json')
+
+
+@api_view(['GET'])
+@authentication_classes([JWTAuthentication, SessionAuthentication])
+@permission_classes([IsAdminUser])
+def appointment_calendar_ics(request):
+    """
+    Staff: appointments in a date range as an iCalendar (.ics) file, streamed
+    GET /api/appointments/calendar.ics?from=2026-01-01&to=2026-12-31
+    """
+    date_from, date_to, error = date_range_params(request, MAX_CALENDAR_DAYS)
+    if error:
+        return error
+    rows = calendar_rows(date_from, date_to, calendar_statuses(request))
+    response = StreamingHttpResponse(iter_ics(rows, request.get_host()), content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="appointments-{date_from}-{date_to}.ics"'
+    return response
@@ -96,7 +96,6 @@ const GOOGLE_CLIENT_ID = 'YOUR_GOOGLE_CLIENT_ID'; // Replace with your Google Cl
 // Shop page functionality
 document.addEventListener('DOMContentLoaded', function() {
     const productContainer = document.getElementById('product-container');
-    const filterButtons = document.querySelectorAll('.product-filters li');
     
     // Authentication Modal Handling
     let pendingProductId = null;
@@ -367,348 +366,54 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
     
-    // Debug: Check if products are loaded
+    // Debug: Check the page is wired up
     console.log('🛒 [INIT] Shop.js loaded successfully!');
-    console.log('🛒 [INIT] Products loaded:', products ? products.length : 'No products');
     console.log('🛒 [INIT] Product container:', productContainer ? 'Found' : 'Not found');
     console.log('🛒 [INIT] AuthManager available:', typeof AuthManager !== 'undefined');
     console.log('🛒 [INIT] User authenticated:', AuthManager.isAuthenticated());
     
-    // Render products function
-    function renderProducts(productsToRender = products) {
-        // console.log('Rendering products:', productsToRender);
-        if (!productContainer) {
-            // console.error('Product container not found!');
-            return;
-        }
-        
-        productContainer.innerHTML = '';
-        
-        if (!productsToRender || productsToRender.length === 0) {
-            // console.log('No products to render');
-            productContainer.innerHTML = '<div class="col-12 text-center"><p>No products found.</p></div>';
-            return;
-        }
-        
-        productsToRender.forEach((product, index) => {
-            // console.log(`Creating product ${index + 1}:`, product);
-            const productElement = createProductElement(product);
-            productContainer.appendChild(productElement);
-        });
-        
-        // Force the container to show content
-        productContainer.style.height = 'auto';
-        productContainer.style.minHeight = '200px';
-        
-        // console.log('Product container after adding products:', productContainer);
-        // console.log('Number of child elements:', productContainer.children.length);
-        
-        // Initialize isotope after rendering (commented out for debugging)
-        // if (typeof $ !== 'undefined' && $.fn.isotope) {
-        //     $('.product-lists').isotope({
-        //         itemSelector: '.single-product-item',
-        //         layoutMode: 'fitRows'
-        //     });
-        // }
-    }
-    
-    // Create product element
-    function createProductElement(product) {
-        // console.log('Creating product element for:', product.name, 'Images:', product.images);
-        const col = document.createElement('div');
-        col.className = `col-lg-4 col-md-6 text-center ${product.category}`;
-        
-        // Get primary image - handle both primary_image and images array
-        let imageUrl = '/static/img/products/product-img-1.jpg';
-        let imageAlt = product.name;
-        
-        if (product.primary_image && product.primary_image.image) {
-            imageUrl = product.primary_image.image;
-            imageAlt = product.primary_image.alt_text || product.name;
-        } else if (product.images && Array.isArray(product.images) && product.images.length > 0) {
-            const primaryImage = product.images.find(img => img.is_primary) || product.images[0];
-            if (primaryImage) {
-                imageUrl = primaryImage.image;
-                imageAlt = primaryImage.alt_text || product.name;
-            }
-        }
-        
-        // Format price
-        const price = parseFloat(product.price);
-        const salePrice = product.sale_price ? parseFloat(product.sale_price) : null;
-        const displayPrice = salePrice || price;
-        const originalPrice = salePrice ? price : null;
-        
-        col.innerHTML = `
-            <div class="single-product-item">
-                <div class="product-image">
-                    <a href="/product/${product.id}/">
-                        <img src="${imageUrl}" alt="${imageAlt}">
-                    </a>
-                    ${product.on_sale ? '<span class="sale-badge">Sale</span>' : ''}
-                </div>
-                <h3>${product.name}</h3>
-                <p class="product-price">
-                    ${originalPrice ? `<span class="original-price">Rs ${originalPrice.toFixed(2)}</span>` : ''}
-                    <span class="current-price">Rs ${displayPrice.toFixed(2)}</span>
-                </p>
-                <a href="/cart/" class="cart-btn" data-product-id="${product.id}">
-                    <i class="fas fa-shopping-cart"></i> Add to Cart
-                </a>
-            </div>
-        `;
-        
-        // console.log('Created product element HTML:', col.outerHTML);
-        return col;
-    }
-    
-    // Filter functionality
-    function setupFilters() {
-        let filteredProducts = products;
+    // Append the next page of server-rendered product cards
+    function setupLoadMore() {
+        const loadMore = document.querySelector('.pagination-wrap .load-more');
+        if (!loadMore || !productContainer || !window.fetch) return;
         
-        filterButtons.forEach(button => {
-            button.addEventListener('click', function() {
-                // console.log('Filter clicked:', this.textContent, 'data-filter:', this.getAttribute('data-filter'));
-                
-                // Remove active class from all buttons
-                filterButtons.forEach(btn => btn.classList.remove('active'));
-                // Add active class to clicked button
-                this.classList.add('active');
-                
-                const filter = this.getAttribute('data-filter');
+        loadMore.textContent = 'Load more';
+        loadMore.addEventListener('click', async (e) => {
+            e.preventDefault();
+            const url = loadMore.dataset.fragment;
+            if (!url || loadMore.classList.contains('loading')) return;
+            
+            loadMore.classList.add('loading');
+            try {
+                const response = await fetch(url, { headers: { 'Accept': 'text/html' } });
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                productContainer.insertAdjacentHTML('beforeend', await response.text());
                 
-                if (filter === '*') {
-                    filteredProducts = products;
-                    // console.log('Showing all products:', filteredProducts.length);
+                const nextPage = response.headers.get('X-Next-Page');
+                if (nextPage) {
+                    const next = new URL(url, window.location.href);
+                    next.searchParams.set('page', nextPage);
+                    loadMore.dataset.fragment = next.pathname + next.search;
                 } else {
-                    const category = filter.replace('.', '');
-                    filteredProducts = products.filter(product => product.category === category);
-                    // console.log(`Filtering by category '${category}':`, filteredProducts.length, 'products found');
-                }
-                
-                // Update pagination for filtered results
-                updatePaginationForFilteredProducts(filteredProducts);
-                // Render first page of filtered results
-                const itemsPerPage = 6;
-                const firstPageProducts = filteredProducts.slice(0, itemsPerPage);
-                renderProducts(firstPageProducts);
-            });
-        });
-        
-        // Function to update pagination for filtered products
-        function updatePaginationForFilteredProducts(filteredProducts) {
-            const paginationContainer = document.querySelector('.pagination-wrap ul');
-            if (!paginationContainer) return;
-            
-            const itemsPerPage = 6;
-            const totalPages = Math.ceil(filteredProducts.length / itemsPerPage);
-            let currentPage = 1;
-            
-            // Clear existing pagination
-            paginationContainer.innerHTML = '';
-            
-            if (totalPages <= 1) {
-                paginationContainer.innerHTML = '';
-                return;
-            }
-            
-            // Create pagination buttons
-            function createPaginationButtons() {
-                paginationContainer.innerHTML = '';
-                
-                // Previous button
-                const prevBtn = document.createElement('li');
-                prevBtn.innerHTML = '<a href="#" class="prev-btn">Prev</a>';
-                prevBtn.addEventListener('click', (e) => {
-                    e.preventDefault();
-                    if (currentPage > 1) {
-                        currentPage--;
-                        updatePagination();
-                        const startIndex = (currentPage - 1) * itemsPerPage;
-                        const endIndex = startIndex + itemsPerPage;
-                        renderProducts(filteredProducts.slice(startIndex, endIndex));
-                    }
-                });
-                paginationContainer.appendChild(prevBtn);
-                
-                // Page numbers
-                for (let i = 1; i <= totalPages; i++) {
-                    const pageBtn = document.createElement('li');
-                    pageBtn.innerHTML = `<a href="#" class="page-btn" data-page="${i}">${i}</a>`;
-                    if (i === currentPage) {
-                        pageBtn.querySelector('a').classList.add('active');
-                    }
-                    pageBtn.addEventListener('click', (e) => {
-                        e.preventDefault();
-                        currentPage = i;
-                        updatePagination();
-                        const startIndex = (currentPage - 1) * itemsPerPage;
-                        const endIndex = startIndex + itemsPerPage;
-                        renderProducts(filteredProducts.slice(startIndex, endIndex));
-                    });
-                    paginationContainer.appendChild(pageBtn);
+                    loadMore.closest('li').remove();
                 }
-                
-                // Next button
-                const nextBtn = document.createElement('li');
-                nextBtn.innerHTML = '<a href="#" class="next-btn">Next</a>';
-                nextBtn.addEventListener('click', (e) => {
-                    e.preventDefault();
-                    if (currentPage < totalPages) {
-                        currentPage++;
-                        updatePagination();
-                        const startIndex = (currentPage - 1) * itemsPerPage;
-                        const endIndex = startIndex + itemsPerPage;
-                        renderProducts(filteredProducts.slice(startIndex, endIndex));
-                    }
+                // The page links no longer describe what is on screen
+                document.querySelectorAll('.pagination-wrap li').forEach(li => {
+                    if (!li.querySelector('.load-more')) li.remove();
                 });
-                paginationContainer.appendChild(nextBtn);
+            } catch (error) {
+                console.error('Failed to load more products:', error);
+                // Fall back to the plain link
+                window.location.href = loadMore.href;
+            } finally {
+                loadMore.classList.remove('loading');
             }
-            
-            function updatePagination() {
-                const pageBtns = paginationContainer.querySelectorAll('.page-btn');
-                pageBtns.forEach(btn => {
-                    btn.classList.remove('active');
-                    if (parseInt(btn.dataset.page) === currentPage) {
-                        btn.classList.add('active');
-                    }
-                });
-                
-                // Update prev/next button states
-                const prevBtn = paginationContainer.querySelector('.prev-btn');
-                const nextBtn = paginationContainer.querySelector('.next-btn');
-                
-                if (prevBtn) {
-                    prevBtn.style.opacity = currentPage === 1 ? '0.5' : '1';
-                    prevBtn.style.pointerEvents = currentPage === 1 ? 'none' : 'auto';
-                }
-                
-                if (nextBtn) {
-                    nextBtn.style.opacity = currentPage === totalPages ? '0.5' : '1';
-                    nextBtn.style.pointerEvents = currentPage === totalPages ? 'none' : 'auto';
-                }
-            }
-            
-            
-            // Initialize pagination
-            createPaginationButtons();
-            updatePagination();
-        }
-    }
-    
-    // Pagination functionality
-    function setupPagination() {
-        const paginationContainer = document.querySelector('.pagination-wrap ul');
-        if (!paginationContainer) return;
-        
-        // Clear existing pagination
-        paginationContainer.innerHTML = '';
-        
-        const itemsPerPage = 6;
-        const totalPages = Math.ceil(products.length / itemsPerPage);
-        let currentPage = 1;
-        
-        // Create pagination buttons
-        function createPaginationButtons() {
-            paginationContainer.innerHTML = '';
-            
-            // Previous button
-            const prevBtn = document.createElement('li');
-            prevBtn.innerHTML = '<a href="#" class="prev-btn">Prev</a>';
-            prevBtn.addEventListener('click', (e) => {
-                e.preventDefault();
-                if (currentPage > 1) {
-                    currentPage--;
-                    updatePagination();
-                    renderProducts(getCurrentPageProducts());
-                }
-            });
-            paginationContainer.appendChild(prevBtn);
-            
-            // Page numbers
-            for (let i = 1; i <= totalPages; i++) {
-                const pageBtn = document.createElement('li');
-                pageBtn.innerHTML = `<a href="#" class="page-btn" data-page="${i}">${i}</a>`;
-                if (i === currentPage) {
-                    pageBtn.querySelector('a').classList.add('active');
-                }
-                pageBtn.addEventListener('click', (e) => {
-                    e.preventDefault();
-                    currentPage = i;
-                    updatePagination();
-                    renderProducts(getCurrentPageProducts());
-                });
-                paginationContainer.appendChild(pageBtn);
-            }
-            
-            // Next button
-            const nextBtn = document.createElement('li');
-            nextBtn.innerHTML = '<a href="#" class="next-btn">Next</a>';
-            nextBtn.addEventListener('click', (e) => {
-                e.preventDefault();
-                if (currentPage < totalPages) {
-                    currentPage++;
-                    updatePagination();
-                    renderProducts(getCurrentPageProducts());
-                }
-            });
-            paginationContainer.appendChild(nextBtn);
-        }
-        
-        function updatePagination() {
-            const pageBtns = paginationContainer.querySelectorAll('.page-btn');
-            pageBtns.forEach(btn => {
-                btn.classList.remove('active');
-                if (parseInt(btn.dataset.page) === currentPage) {
-                    btn.classList.add('active');
-                }
-            });
-            
-            // Update prev/next button states
-            const prevBtn = paginationContainer.querySelector('.prev-btn');
-            const nextBtn = paginationContainer.querySelector('.next-btn');
-            
-            if (prevBtn) {
-                prevBtn.style.opacity = currentPage === 1 ? '0.5' : '1';
-                prevBtn.style.pointerEvents = currentPage === 1 ? 'none' : 'auto';
-            }
-            
-            if (nextBtn) {
-                nextBtn.style.opacity = currentPage === totalPages ? '0.5' : '1';
-                nextBtn.style.pointerEvents = currentPage === totalPages ? 'none' : 'auto';
-            }
-        }
-        
-        function getCurrentPageProducts() {
-            const startIndex = (currentPage - 1) * itemsPerPage;
-            const endIndex = startIndex + itemsPerPage;
-            return products.slice(startIndex, endIndex);
-        }
-        
-        // Initialize pagination
-        createPaginationButtons();
-        updatePagination();
-        
-        // Store pagination functions globally for filter updates
-        window.updatePagination = updatePagination;
-        window.getCurrentPageProducts = getCurrentPageProducts;
-        window.currentPage = () => currentPage;
+        });
     }
     
     // Initialize everything
     function init() {
-        // console.log('Initializing shop...');
-        
-        // Debug: Show available categories
-        const categories = [...new Set(products.map(p => p.category))];
-        // console.log('Available product categories:', categories);
-        
-        setupPagination();
-        // Render first page of products
-        const itemsPerPage = 6;
-        const firstPageProducts = products.slice(0, itemsPerPage);
-        renderProducts(firstPageProducts);
-        setupFilters();
+        setupLoadMore();
         updateCartCount();
     }
     